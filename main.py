@@ -1,15 +1,65 @@
 """
 DoNotePad - A lightweight productivity app using Flet (Flutter for Python).
 """
+import asyncio
 import flet as ft
 import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
 from src.models.todo_manager import TodoManager
 from src.models.notes_manager import NotesManager, Note
 from src.models.todo_item import TodoItem
 
 
+# Shared styling, reused by every filter button and todo card tag
+_FILTER_BUTTON_PADDING = ft.padding.symmetric(horizontal=8, vertical=4)
+_TAG_PADDING = ft.padding.symmetric(horizontal=8, vertical=2)
+_TAG_RADIUS = 10
+
+_UNSELECTED_FILTER_STYLE = ft.ButtonStyle(
+    bgcolor=None,
+    color=ft.Colors.GREY_800,
+    padding=_FILTER_BUTTON_PADDING,
+)
+
+# Priority dropdown choices (key, label) for the todo dialogs. Only the data
+# is shared: a Flet control can't be mounted in more than one dropdown.
+_PRIORITY_CHOICES = (
+    ("none", "None"),
+    ("A", "A (Highest)"),
+    ("B", "B (High)"),
+    ("C", "C (Medium)"),
+    ("D", "D (Low)"),
+    ("E", "E (Lowest)"),
+)
+
+# Latest date selectable as a todo due date
+_LAST_DUE_DATE = date(2030, 12, 31)
+
+# Filter button styling per button type:
+# (selected button style, attribute holding the buttons)
+_FILTER_STYLES = {
+    "date": (
+        ft.ButtonStyle(bgcolor=ft.Colors.BLUE_100, color=ft.Colors.BLUE_900, padding=_FILTER_BUTTON_PADDING),
+        "todo_filter_buttons",
+    ),
+    "context": (
+        ft.ButtonStyle(bgcolor=ft.Colors.GREEN_100, color=ft.Colors.GREEN_900, padding=_FILTER_BUTTON_PADDING),
+        "context_filter_buttons",
+    ),
+    "project": (
+        ft.ButtonStyle(bgcolor=ft.Colors.PURPLE_100, color=ft.Colors.PURPLE_900, padding=_FILTER_BUTTON_PADDING),
+        "project_filter_buttons",
+    ),
+}
+
+# Number of todo cards kept around beyond the ones currently displayed
+_CARD_CACHE_SIZE = 500
+
 class DoNotePadApp:
     """Main DoNotePad application using Flet."""
     
@@ -21,32 +71,71 @@ class DoNotePadApp:
         self.current_note = None
         self.note_has_unsaved_changes = False
         self.config_file = os.path.expanduser("~/.donotepad_config.json")
+        self._config = {}  # Last loaded/saved configuration
+        self._config_lock = threading.Lock()
         
         # Auto-save configuration (simplified)
         self.auto_save_delay = 10  # Default 10 seconds (kept for config compatibility)
         self.auto_save_enabled = True  # Kept for config compatibility
         
+        # Notes search debouncing
+        self.search_debounce_delay = 0.15  # Seconds of typing pause before searching
+        self._search_timer = None
+        self._last_search_query = ""
+        self._search_pool = ThreadPoolExecutor(max_workers=1)
+        self._search_future = None
+        
+        # Note preview debouncing: markdown is re-rendered once typing pauses
+        self.preview_debounce_delay = 0.12
+        self._preview_timer = None
+        
         # Filter state
         self.date_filter = "all"
         self.selected_context = "all"
         self.selected_project = "all"
         self.current_tab = 0
         
+        # Cached filter button counts, recomputed in a single pass on data change
+        self._count_cache = {'date': {}, 'context': {}, 'project': {}}
+        self._count_cache_valid = False
+        
+        # Built todo cards keyed by todo fingerprint (LRU), reused across refreshes
+        self._card_cache = OrderedDict()
+        self._card_keys = {}  # id(todo) -> fingerprint of its cached card
+        self._card_cache_date = None
+        
+        # Batched page updates (see _batch_updates). Handlers, timers and the
+        # executor all run on different threads, so the batch state is only
+        # touched while holding _ui_lock.
+        self._ui_lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._batch_controls = []  # Controls to update at batch end; None = whole page
+        
         # UI components
         self.data_folder_display = None
+        self.todo_filter_panel = None
         self.todo_list_view = None
         self.notes_list_view = None
         self.note_editor = None
         self.note_status_text = None
         self.save_button = None
+        self._last_status_state = None  # (text, text color, save icon color) last shown
         self.todo_filter_buttons = {}
         self.context_filter_buttons = {}
         self.project_filter_buttons = {}
+        self._count_text = {}  # (button_type, filter_type) -> count Text control
         self.context_filter_dropdown = None
         self.project_filter_dropdown = None
         self.sort_buttons = None
         self.main_tabs = None
         self.current_dialog = None
+        self._save_prompt_dialog = None  # Shared "Unsaved Changes" dialog, built in build_ui
+        self._due_date_picker = None  # Shared todo due date picker, built in build_ui
+        self._due_date_picked = None  # Callback of the dialog that opened the picker
+        self._save_prompt_handlers = {}  # Button action -> callable for the open prompt
+        self._sections = {}  # Tab index -> section widget tree, built once
+        self._note_cards = {}  # Note filepath -> card in the notes list
         
         # Load configuration
         self.load_config()
@@ -54,15 +143,69 @@ class DoNotePadApp:
         self.setup_page()
         self.build_ui()
         
-        # Auto-load data folder if available
-        if self.data_folder and os.path.exists(self.data_folder):
-            self.set_data_folder(self.data_folder)
-        else:
-            pass  # No valid data folder to auto-load
+        # Auto-load data folder in the background once the UI is shown
+        if self.data_folder:
+            self.content_area.content = ft.Container(
+                ft.Text("Loading…", size=14, color=ft.Colors.GREY_600),
+                alignment=ft.alignment.center,
+                expand=True,
+            )
+            self._request_update()
+            self.page.run_task(self._async_bootstrap)
         
         # Show welcome message if no data folder is set
         self.page.on_route_change = lambda _: None
     
+    async def _async_bootstrap(self):
+        """Load the configured data folder without blocking the first paint."""
+        loop = asyncio.get_running_loop()
+        try:
+            if await loop.run_in_executor(None, os.path.exists, self.data_folder):
+                await loop.run_in_executor(None, self.set_data_folder, self.data_folder)
+        finally:
+            # Replace the loading placeholder with the active tab
+            self.content_area.content = self.get_tab_section(self.current_tab)
+            self._request_update()
+    
+    @contextmanager
+    def _batch_updates(self):
+        """Coalesce page updates requested inside the block into a single one.
+        
+        The lock is held for the whole block, so batches from different
+        threads run one after another instead of sharing one depth count.
+        """
+        with self._ui_lock:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._batch_dirty:
+                    controls = self._batch_controls
+                    self._batch_dirty = False
+                    self._batch_controls = []
+                    self._update_controls(controls if controls is not None else ())
+    
+    def _request_update(self, *controls):
+        """Update the given controls (or the whole page) now, or once the outermost batch finishes."""
+        with self._ui_lock:
+            if self._batch_depth:
+                if not controls:
+                    self._batch_controls = None
+                elif self._batch_controls is not None:
+                    self._batch_controls.extend(controls)
+                self._batch_dirty = True
+            else:
+                self._update_controls(controls)
+    
+    def _update_controls(self, controls):
+        """Send only the given controls to the client, or the whole page."""
+        # Controls not yet added to the page can't be updated on their own
+        if controls and all(control.page for control in controls):
+            self.page.update(*dict.fromkeys(controls))
+        else:
+            self.page.update()
+    
     def on_tab_change(self, e):
         """Handle tab changes."""
         # Check for unsaved changes before switching
@@ -73,23 +216,7 @@ class DoNotePadApp:
             )
             return
         
-        if e.control.selected_index == 0:  # Todos tab
-            self.content_area.content = self.build_todo_section()
-            self.current_tab = 0
-            # Refresh todos after UI is built
-            if self.todo_manager:
-                self.page.update()  # Ensure UI is updated first
-                self.refresh_todos()
-                self.update_context_filter()
-                self.update_project_filter()
-        else:  # Notes tab
-            self.content_area.content = self.build_notes_section()
-            self.current_tab = 1
-            # Refresh notes after UI is built
-            if self.notes_manager:
-                self.page.update()  # Ensure UI is updated first
-                self.refresh_notes()
-        self.page.update()
+        self.show_tab_section(e.control.selected_index)
     
     def switch_to_tab(self, tab_index):
         """Programmatically switch to a tab."""
@@ -97,23 +224,31 @@ class DoNotePadApp:
         if hasattr(self, 'tab_component') and self.tab_component:
             self.tab_component.selected_index = tab_index
         
-        if tab_index == 0:  # Todos tab
-            self.content_area.content = self.build_todo_section()
-            self.current_tab = 0
-            # Refresh todos after UI is built
-            if self.todo_manager:
-                self.page.update()  # Ensure UI is updated first
-                self.refresh_todos()
-                self.update_context_filter()
-                self.update_project_filter()
-        else:  # Notes tab
-            self.content_area.content = self.build_notes_section()
-            self.current_tab = 1
-            # Refresh notes after UI is built
-            if self.notes_manager:
-                self.page.update()  # Ensure UI is updated first
-                self.refresh_notes()
-        self.page.update()
+        self.show_tab_section(tab_index)
+    
+    def get_tab_section(self, tab_index):
+        """Get the section for a tab, building it on first access."""
+        section = self._sections.get(tab_index)
+        if section is None:
+            section = self.build_todo_section() if tab_index == 0 else self.build_notes_section()
+            self._sections[tab_index] = section
+        return section
+    
+    def show_tab_section(self, tab_index):
+        """Show the cached section for a tab and refresh its data."""
+        with self._batch_updates():
+            self.content_area.content = self.get_tab_section(tab_index)
+            self.current_tab = tab_index
+            
+            if tab_index == 0:  # Todos tab
+                if self.todo_manager:
+                    self.refresh_todos()
+                    self.update_tag_filters()
+            else:  # Notes tab
+                # Load notes lazily, then refresh the list
+                if self._ensure_notes_manager():
+                    self.refresh_notes()
+            self._request_update()
         
     def setup_page(self):
         """Configure the page settings."""
@@ -128,7 +263,9 @@ class DoNotePadApp:
         # Add keyboard event handler
         self.page.on_keyboard_event = self.on_keyboard_event
         
-        # Add window close event handler
+        # Add window close event handler; Flet only sends the "close" event
+        # when closing is prevented, so the handler closes the window itself
+        self.page.window_prevent_close = True
         self.page.on_window_event = self.on_window_event
     
     def load_config(self):
@@ -137,6 +274,7 @@ class DoNotePadApp:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
+                    self._config = config
                     self.data_folder = config.get('data_folder')
                     self.auto_save_delay = config.get('auto_save_delay', 10)
                     self.auto_save_enabled = config.get('auto_save_enabled', True)
@@ -144,26 +282,41 @@ class DoNotePadApp:
             print(f"Error loading config: {e}")
     
     def save_config(self):
-        """Save configuration to file."""
-        try:
-            config = {
-                'data_folder': self.data_folder,
-                'auto_save_delay': self.auto_save_delay,
-                'auto_save_enabled': self.auto_save_enabled
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        """Save configuration to file if it changed."""
+        config = {
+            'data_folder': self.data_folder,
+            'auto_save_delay': self.auto_save_delay,
+            'auto_save_enabled': self.auto_save_enabled
+        }
+        if config == self._config:
+            return
+        self._config = config
+        
+        # Write in the background so the UI thread doesn't wait on disk
+        threading.Thread(target=self._write_config, daemon=True).start()
+    
+    def _write_config(self):
+        """Write the latest configuration atomically via a temporary file."""
+        with self._config_lock:
+            try:
+                tmp_file = self.config_file + '.tmp'
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._config, f, indent=2)
+                os.replace(tmp_file, self.config_file)
+            except Exception as e:
+                print(f"Error saving config: {e}")
     
     def on_window_event(self, e):
         """Handle window events like closing."""
         if e.data == "close":
+            # Don't leave a debounced todo.txt write behind
+            if self.todo_manager:
+                self.todo_manager.flush()
             if self.current_note and self.note_has_unsaved_changes:
-                # Prevent the window from closing immediately
-                e.prevent_default = True
+                # Keep the window open until the user has chosen
                 self.show_save_on_close_dialog()
-            # If no unsaved changes, let the window close normally
+            else:
+                self.page.window_destroy()
     
     def on_keyboard_event(self, e: ft.KeyboardEvent):
         """Handle keyboard events for shortcuts."""
@@ -218,6 +371,32 @@ class DoNotePadApp:
         
     def build_ui(self):
         """Build the user interface."""
+        # Single directory picker reused for every folder selection
+        self._folder_picker = ft.FilePicker(on_result=self._on_folder_result)
+        self.page.overlay.append(self._folder_picker)
+        
+        # Single due date picker shared by the add and edit todo dialogs
+        self._due_date_picker = ft.DatePicker(
+            on_change=self._on_due_date_picked,
+            last_date=_LAST_DUE_DATE,
+        )
+        self.page.overlay.append(self._due_date_picker)
+        
+        # Single "Unsaved Changes" prompt; its text and actions are set per use
+        self._save_prompt_save_button = ft.ElevatedButton(
+            "Save & Continue", data="save", on_click=self._on_save_prompt_action
+        )
+        self._save_prompt_dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Text("Unsaved Changes"),
+            content=ft.Text(""),
+            actions=[
+                ft.TextButton("Cancel", data="cancel", on_click=self._on_save_prompt_action),
+                ft.TextButton("Don't Save", data="discard", on_click=self._on_save_prompt_action),
+                self._save_prompt_save_button,
+            ],
+        )
+        
         # Create compact data folder section for header
         self.data_folder_display = ft.Text(
             self.data_folder if self.data_folder else "No folder selected",
@@ -264,7 +443,7 @@ class DoNotePadApp:
         
         # Content area
         self.content_area = ft.Container(
-            content=self.build_todo_section(),  # Start with todos
+            content=self.get_tab_section(0),  # Start with todos
             expand=True,
         )
         
@@ -417,38 +596,31 @@ class DoNotePadApp:
             scroll=ft.ScrollMode.AUTO,
         )
         
+        self.todo_filter_panel = filter_content
         return filter_content
     
     def create_filter_button(self, filter_type: str, label: str, button_type: str = "date", selected: bool = False):
         """Create a unified filter button with todo count."""
-        # Get count based on button type
-        if button_type == "date":
-            count = self.count_todos_by_date_filter(filter_type)
-            onclick_func = lambda _: self.set_filter("date", filter_type)
-            button_dict = self.todo_filter_buttons
-            selected_color = ft.Colors.BLUE_100
-        elif button_type == "context":
-            count = self.count_todos_by_context(filter_type)
-            onclick_func = lambda _: self.set_filter("context", filter_type)
-            button_dict = self.context_filter_buttons
-            selected_color = ft.Colors.GREEN_100
-        else:  # project
-            count = self.count_todos_by_project(filter_type)
-            onclick_func = lambda _: self.set_filter("project", filter_type)
-            button_dict = self.project_filter_buttons
-            selected_color = ft.Colors.PURPLE_100
+        # Get count and styling based on button type
+        count = self.get_filter_count(button_type, filter_type)
+        selected_style, buttons_attr = _FILTER_STYLES[button_type]
+        button_dict = getattr(self, buttons_attr)
+        is_date = button_type == "date"
+        
+        count_text = ft.Text(
+            str(count), 
+            size=11, 
+            weight=ft.FontWeight.W_400,
+            color=ft.Colors.GREY_700
+        )
+        self._count_text[(button_type, filter_type)] = count_text
         
         # Create a row with label on left and count on right
         button_content = ft.Row(
             [
                 ft.Text(label, size=13, weight=ft.FontWeight.W_500),
                 ft.Container(
-                    content=ft.Text(
-                        str(count), 
-                        size=11, 
-                        weight=ft.FontWeight.W_400,
-                        color=ft.Colors.GREY_700
-                    ),
+                    content=count_text,
                     bgcolor=ft.Colors.GREY_200,
                     border_radius=ft.border_radius.all(8),
                     padding=ft.padding.symmetric(vertical=2, horizontal=6),
@@ -460,17 +632,10 @@ class DoNotePadApp:
         
         button = ft.TextButton(
             content=button_content,
-            on_click=onclick_func,
-            style=ft.ButtonStyle(
-                bgcolor=selected_color if selected else None,
-                color=ft.Colors.BLUE_900 if button_type == "date" and selected else 
-                      ft.Colors.GREEN_900 if button_type == "context" and selected else 
-                      ft.Colors.PURPLE_900 if button_type == "project" and selected else 
-                      ft.Colors.GREY_800,
-                padding=ft.padding.symmetric(horizontal=8, vertical=4),
-            ),
-            width=200 if button_type == "date" else None,
-            expand=True if button_type != "date" else False,
+            on_click=lambda _: self.set_filter(button_type, filter_type),
+            style=selected_style if selected else _UNSELECTED_FILTER_STYLE,
+            width=200 if is_date else None,
+            expand=not is_date,
         )
         button_dict[filter_type] = button
         return button
@@ -496,7 +661,7 @@ class DoNotePadApp:
         search_box = ft.TextField(
             label="Search notes...",
             prefix_icon=ft.Icons.SEARCH,
-            on_change=self.search_notes,
+            on_change=self._debounced_search,
         )
         
         # Notes list panel
@@ -606,158 +771,227 @@ class DoNotePadApp:
         
         return notes_section
     
-    async def select_data_folder(self, e):
+    def select_data_folder(self, e):
         """Handle data folder selection."""
-        # Create a file picker for directories
-        def on_result(e: ft.FilePickerResultEvent):
-            if e.path:
-                self.set_data_folder(e.path)
-        
-        file_picker = ft.FilePicker(on_result=on_result)
-        self.page.overlay.append(file_picker)
-        self.page.update()
-        
         # Open directory picker
-        file_picker.get_directory_path()
+        self._folder_picker.get_directory_path()
+    
+    def _on_folder_result(self, e: ft.FilePickerResultEvent):
+        """Handle the result of the data folder picker."""
+        if e.path:
+            self.set_data_folder(e.path)
     
     def set_data_folder(self, folder_path: str):
         """Set the data folder and initialize managers."""
         try:
-            self.data_folder = folder_path
-            # Update data folder display if it exists  
-            if hasattr(self, 'data_folder_display') and self.data_folder_display:
-                folder_name = os.path.basename(folder_path)
-                self.data_folder_display.value = folder_name
-            else:
-                pass  # data_folder_display not available yet
-            
-            # Save configuration
-            self.save_config()
-            
-            # Initialize managers
-            self.todo_manager = TodoManager(folder_path)
-            self.notes_manager = NotesManager(folder_path)
-            
-            # Refresh UI
-            self.refresh_todos()
-            # Only refresh notes if the UI components are ready
-            if hasattr(self, 'notes_list_view') and self.notes_list_view:
-                self.refresh_notes()
-            else:
-                pass  # Notes UI not ready yet, skipping refresh_notes
-            self.update_context_filter()
-            self.update_project_filter()
-            self.update_filter_counts()
-            
-            self.page.update()
+            # Write out any debounced save before leaving the old folder, and
+            # load the new todos before taking the UI lock, so clicks made
+            # meanwhile don't wait on the disk
+            if self.todo_manager:
+                self.todo_manager.flush()
+            todo_manager = TodoManager(folder_path)
             
+            with self._batch_updates():
+                self.data_folder = folder_path
+                # Update data folder display if it exists  
+                if hasattr(self, 'data_folder_display') and self.data_folder_display:
+                    folder_name = os.path.basename(folder_path)
+                    self.data_folder_display.value = folder_name
+                else:
+                    pass  # data_folder_display not available yet
+                
+                # Save configuration
+                self.save_config()
+                
+                # Initialize managers (notes are loaded when the Notes tab is shown)
+                self.todo_manager = todo_manager
+                self.notes_manager = None
+                # Drop any search still running over the old folder's notes
+                if self._search_future:
+                    self._search_future.cancel()
+                    self._search_future = None
+                self._note_cards.clear()
+                self.invalidate_filter_counts()
+                self._card_cache.clear()
+                self._card_keys.clear()
+                
+                # Refresh UI
+                self.refresh_todos()
+                # Only load notes if the Notes tab is currently shown
+                if self.current_tab == 1 and self._ensure_notes_manager():
+                    self.refresh_notes()
+                self.update_tag_filters()
+                self.update_filter_counts()
+                
+                self._request_update()
+                
         except Exception as ex:
             import traceback
             traceback.print_exc()
             self.show_error("Failed to initialize data folder", str(ex))
     
+    def _ensure_notes_manager(self):
+        """Create the notes manager on first use and return it."""
+        if self.notes_manager is None and self.data_folder and self.todo_manager:
+            self.notes_manager = NotesManager(self.data_folder)
+        return self.notes_manager
+    
     def refresh_todos(self):
         """Refresh the todo list based on current filters."""
-        if not self.todo_manager:
-            return
-        
-        # Safety check for todo_list_view
-        if not hasattr(self, 'todo_list_view') or not self.todo_list_view:
-            return
-        
-        # Get current filter settings
-        date_filter = self.date_filter
-        context_filter = self.selected_context
-        project_filter = self.selected_project
-        sort_by = list(self.sort_buttons.selected)[0] if self.sort_buttons and self.sort_buttons.selected else "default"
-        
-        # Get filtered todos
-        if date_filter == "today":
-            todos = self.todo_manager.get_todos_due_today()
-        elif date_filter == "upcoming":
-            todos = self.todo_manager.get_todos_due_upcoming()
-        elif date_filter == "someday":
-            todos = self.todo_manager.get_todos_someday()
-        elif date_filter == "completed":
-            todos = self.todo_manager.get_completed_todos()
-        else:
-            # "all" filter - exclude completed tasks
-            todos = [todo for todo in self.todo_manager.items if not todo.completed]
-        
-        # Filter by context
-        if context_filter and context_filter != "all":
-            todos = [todo for todo in todos if context_filter in todo.contexts]
-        
-        # Filter by project
-        if project_filter and project_filter != "all":
-            todos = [todo for todo in todos if project_filter in todo.projects]
-        
-        # Sort todos (default: by deadline then priority)
-        if sort_by == "priority":
-            todos = self.todo_manager.sort_by_priority(todos)
-        elif sort_by == "due_date":
-            todos = self.todo_manager.sort_by_due_date(todos)
-        else:
-            # Default sorting: by deadline then priority
-            todos = self.sort_by_deadline_then_priority(todos)
-        
-        # Update list view
-        self.todo_list_view.controls.clear()
-        for todo in todos:
-            todo_card = self.create_todo_card(todo)
-            self.todo_list_view.controls.append(todo_card)
-        
-        self.page.update()
+        with self._batch_updates():
+            if not self.todo_manager:
+                return
+            
+            # Safety check for todo_list_view
+            if not hasattr(self, 'todo_list_view') or not self.todo_list_view:
+                return
+            
+            # Get current filter settings
+            date_filter = self.date_filter
+            context_filter = self.selected_context
+            project_filter = self.selected_project
+            sort_by = list(self.sort_buttons.selected)[0] if self.sort_buttons and self.sort_buttons.selected else "default"
+            
+            # Get date-filtered todos
+            if date_filter == "today":
+                todos = self.todo_manager.get_todos_due_today()
+            elif date_filter == "upcoming":
+                todos = self.todo_manager.get_todos_due_upcoming()
+            elif date_filter == "someday":
+                todos = self.todo_manager.get_todos_someday()
+            elif date_filter == "completed":
+                todos = self.todo_manager.get_completed_todos()
+            else:
+                # "all" filter - exclude completed tasks
+                todos = self.todo_manager.get_pending_todos()
+            
+            # Filter by context and project in a single pass
+            if context_filter == "all":
+                context_filter = None
+            if project_filter == "all":
+                project_filter = None
+            
+            if context_filter or project_filter:
+                # Tag filters are set lookups against the manager's indexes
+                context_todos = self.todo_manager.by_context.get(context_filter, set())
+                project_todos = self.todo_manager.by_project.get(project_filter, set())
+                
+                def matches(todo):
+                    return ((not context_filter or todo in context_todos)
+                            and (not project_filter or todo in project_todos))
+                
+                todos = [todo for todo in todos if matches(todo)]
+            
+            # Sort todos (default: by deadline then priority)
+            if sort_by == "priority":
+                todos = self.todo_manager.sort_by_priority(todos)
+            elif sort_by == "due_date":
+                todos = self.todo_manager.sort_by_due_date(todos)
+            else:
+                # Default sorting: by deadline then priority
+                todos = self.sort_by_deadline_then_priority(todos)
+            
+            # Relative due date labels and the date filter counts go stale
+            # once the day changes
+            today = date.today()
+            if self._card_cache_date != today:
+                self._card_cache.clear()
+                self._card_keys.clear()
+                self._card_cache_date = today
+                self.invalidate_filter_counts()
+                self.update_filter_counts()
+            
+            # Update list view, reusing cards for unchanged todos
+            tomorrow = today + timedelta(days=1)
+            due_labels = {}  # Due date -> (label, color), shared by all cards
+            desired = [self.get_todo_card(todo, today, tomorrow, due_labels) for todo in todos]
+            
+            # Evict least recently used cards, never the ones being displayed
+            while len(self._card_cache) > max(_CARD_CACHE_SIZE, len(desired)):
+                self._card_cache.popitem(last=False)
+            
+            controls = self.todo_list_view.controls
+            if len(controls) != len(desired) or any(a is not b for a, b in zip(controls, desired)):
+                controls[:] = desired
+            
+            self._request_update(self.todo_list_view)
     
     def sort_by_deadline_then_priority(self, todos):
         """Sort todos by deadline first, then by priority."""
         def sort_key(todo):
-            # First sort by due date (None values go to the end)
-            due_date_key = date.max
-            if todo.due_date:
-                if isinstance(todo.due_date, str):
-                    # Handle case where due_date might be a string
-                    try:
-                        due_date_key = datetime.strptime(todo.due_date, '%Y-%m-%d').date()
-                    except ValueError:
-                        due_date_key = date.max
-                else:
-                    due_date_key = todo.due_date
-            
-            # Then sort by priority (A=0, B=1, C=2, D=3, E=4, None=5)
-            priority_order = {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'E': 4}
-            priority_key = priority_order.get(todo.priority, 5)
-            
-            # Completed todos go to the bottom
-            completed_key = 1 if todo.completed else 0
-            
-            return (completed_key, due_date_key, priority_key)
+            # Completed todos go to the bottom, then earliest due date
+            # (no due date last), then priority (A-E, then none)
+            return (todo.completed, todo.due_sort_key, todo.priority_sort_key)
         
         return sorted(todos, key=sort_key)
     
-    def create_todo_card(self, todo: TodoItem):
-        """Create a beautiful card for a todo item."""
-        
-        def get_clean_description(description: str) -> str:
-            """Extract clean description without projects, contexts, or due dates."""
-            import re
-            # Remove projects (+project)
-            text = re.sub(r'\s*\+\w+', '', description)
-            # Remove contexts (@context)
-            text = re.sub(r'\s*@\w+', '', text)
-            # Remove due dates (due:YYYY-MM-DD)
-            text = re.sub(r'\s*due:\d{4}-\d{2}-\d{2}', '', text)
-            return text.strip()
+    def get_todo_card(self, todo: TodoItem, today=None, tomorrow=None, due_labels=None):
+        """Get the card for a todo, reusing a cached one if the todo is unchanged."""
+        key = (id(todo), todo.completed, todo.priority, tuple(todo.projects),
+               tuple(todo.contexts), todo.due_date, todo.description)
+        card = self._card_cache.get(key)
+        if card is None:
+            self.invalidate_todo_card(todo)
+            card = self._card_cache[key] = self.create_todo_card(todo, today, tomorrow, due_labels)
+            self._card_keys[id(todo)] = key
+        else:
+            self._card_cache.move_to_end(key)
+        return card
+    
+    def invalidate_todo_card(self, todo: TodoItem):
+        """Drop the cached card of a changed or removed todo."""
+        key = self._card_keys.pop(id(todo), None)
+        if key is not None:
+            self._card_cache.pop(key, None)
+    
+    def _todo_from_event(self, e):
+        """Look up the todo a card control belongs to via its data payload."""
+        if not self.todo_manager:
+            return None
+        return self.todo_manager.by_id.get(e.control.data)
+    
+    def _on_toggle_todo(self, e):
+        """Handle a todo card checkbox change."""
+        todo = self._todo_from_event(e)
+        if todo:
+            self.toggle_todo_completion(todo)
+    
+    def _on_edit_todo(self, e):
+        """Handle a click on a todo card or its edit button."""
+        todo = self._todo_from_event(e)
+        if todo:
+            self.edit_todo_dialog(todo)
+    
+    def get_due_date_label(self, due_date: date, today: date, tomorrow: date):
+        """Get the badge text and color for a due date relative to today."""
+        if due_date < today:
+            return f"Overdue ({(today - due_date).days} days)", ft.Colors.RED
+        if due_date == today:
+            return "Today", ft.Colors.ORANGE
+        if due_date == tomorrow:
+            return "Tomorrow", ft.Colors.ORANGE_300
+        days_diff = (due_date - today).days
+        if days_diff <= 5:
+            return f"+{days_diff} days", ft.Colors.BLUE
+        # Lighter blue for distant deadlines
+        return due_date.strftime('%Y-%m-%d'), ft.Colors.BLUE_200
+    
+    def create_todo_card(self, todo: TodoItem, today=None, tomorrow=None, due_labels=None):
+        """Create a beautiful card for a todo item.
         
+        today, tomorrow and the due_labels cache can be passed in when
+        building many cards so they're computed once per refresh.
+        """
         # Get clean description (without projects, contexts, or due date)
-        clean_description = get_clean_description(todo.description)
+        clean_description = todo.clean_description
         
         # First row: checkbox, trimmed title, edit button
         first_row = ft.Row(
             [
                 ft.Checkbox(
                     value=todo.completed,
-                    on_change=lambda e, t=todo: self.toggle_todo_completion(t),
+                    data=id(todo),
+                    on_change=self._on_toggle_todo,
                 ),
                 ft.Container(
                     ft.Text(
@@ -772,7 +1006,8 @@ class DoNotePadApp:
                     icon=ft.Icons.EDIT,
                     icon_size=16,
                     tooltip="Edit todo",
-                    on_click=lambda e, t=todo: self.edit_todo_dialog(t),
+                    data=id(todo),
+                    on_click=self._on_edit_todo,
                 ),
             ],
             alignment=ft.MainAxisAlignment.START,
@@ -793,124 +1028,164 @@ class DoNotePadApp:
             }
             second_row_left_items.append(
                 ft.Container(
-                    ft.Text(f"{todo.priority}", color=ft.Colors.WHITE, weight=ft.FontWeight.BOLD, size=12),
+                    ft.Text(todo.priority, color=ft.Colors.WHITE, weight=ft.FontWeight.BOLD, size=12),
                     bgcolor=colors.get(todo.priority, ft.Colors.GREY),
-                    padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                    border_radius=10,
+                    padding=_TAG_PADDING,
+                    border_radius=_TAG_RADIUS,
                 )
             )
         
         # Projects - create individual tags
         if todo.projects:
-            for project in todo.projects:
+            for project_label in todo.formatted_projects:
                 second_row_left_items.append(
                     ft.Container(
-                        ft.Text(f"+{project}", color=ft.Colors.PURPLE_800, size=12),
+                        ft.Text(project_label, color=ft.Colors.PURPLE_800, size=12),
                         bgcolor=ft.Colors.PURPLE_50,
-                        padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                        border_radius=10,
+                        padding=_TAG_PADDING,
+                        border_radius=_TAG_RADIUS,
                     )
                 )
         
         # Contexts - create individual tags
         if todo.contexts:
-            for context in todo.contexts:
+            for context_label in todo.formatted_contexts:
                 second_row_left_items.append(
                     ft.Container(
-                        ft.Text(f"@{context}", color=ft.Colors.GREEN_800, size=12),
+                        ft.Text(context_label, color=ft.Colors.GREEN_800, size=12),
                         bgcolor=ft.Colors.GREEN_50,
-                        padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                        border_radius=10,
+                        padding=_TAG_PADDING,
+                        border_radius=_TAG_RADIUS,
                     )
                 )
         
         # Due date (will be positioned on far right)
         if todo.due_date:
-            today = date.today()
-            if todo.due_date < today:
-                due_text = f"Overdue ({(today - todo.due_date).days} days)"
-                due_color = ft.Colors.RED
-            elif todo.due_date == today:
-                due_text = "Today"
-                due_color = ft.Colors.ORANGE
-            elif todo.due_date == today + timedelta(days=1):
-                due_text = "Tomorrow"
-                due_color = ft.Colors.ORANGE_300
-            else:
-                days_diff = (todo.due_date - today).days
-                if days_diff <= 5:
-                    due_text = f"+{days_diff} days"
-                    due_color = ft.Colors.BLUE
-                else:
-                    due_text = todo.due_date.strftime('%Y-%m-%d')
-                    due_color = ft.Colors.BLUE_200  # Lighter blue for distant deadlines
+            if today is None:
+                today = date.today()
+            if tomorrow is None:
+                tomorrow = today + timedelta(days=1)
+            if due_labels is None:
+                due_labels = {}
+            
+            due_label = due_labels.get(todo.due_date)
+            if due_label is None:
+                due_label = due_labels[todo.due_date] = self.get_due_date_label(todo.due_date, today, tomorrow)
+            due_text, due_color = due_label
             
             due_date_item = ft.Container(
                 ft.Text(due_text, color=ft.Colors.WHITE, size=12),
                 bgcolor=due_color,
-                padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                border_radius=10,
+                padding=_TAG_PADDING,
+                border_radius=_TAG_RADIUS,
             )
         
-        # Second row with deadline on far right
-        if second_row_left_items or due_date_item:
-            second_row = ft.Row(
-                [
-                    ft.Row(second_row_left_items, spacing=5, wrap=True),
-                    due_date_item if due_date_item else ft.Container(),
-                ],
-                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+        # Second row with deadline on far right; rows without content are
+        # left out instead of being padded with empty containers
+        rows = [first_row]
+        if second_row_left_items:
+            second_row_items = [ft.Row(second_row_left_items, spacing=5, wrap=True)]
+            if due_date_item:
+                second_row_items.append(due_date_item)
+            rows.append(
+                ft.Row(
+                    second_row_items,
+                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                )
             )
-        else:
-            second_row = ft.Container()
+        elif due_date_item:
+            # Deadline only: no need for the nested tag row
+            rows.append(ft.Row([due_date_item], alignment=ft.MainAxisAlignment.END))
         
         # Card container
         return ft.Card(
             ft.Container(
                 ft.Column(
-                    [first_row, second_row],
+                    rows,
                     spacing=5,
                 ),
                 padding=10,
-                on_click=lambda e, t=todo: self.edit_todo_dialog(t),
+                data=id(todo),
+                on_click=self._on_edit_todo,
             ),
             elevation=1,
         )
     
-    def refresh_notes(self):
-        """Refresh the notes list."""
-        if not self.notes_manager:
-            return
-        
-        # Safety check for notes_list_view
-        if not hasattr(self, 'notes_list_view') or not self.notes_list_view:
-            return
-        
-        notes = self.notes_manager.get_notes_by_title_sorted()
-        
-        self.notes_list_view.controls.clear()
-        for note in notes:
-            # Check if this is the currently selected note using filepath as identifier
-            is_selected = self.current_note and self.current_note.filepath == note.filepath
+    def refresh_notes(self, notes=None):
+        """Refresh the notes list, showing the given notes or the current search results."""
+        with self._batch_updates():
+            if not self.notes_manager:
+                return
             
-            note_card = ft.Card(
-                ft.ListTile(
-                    title=ft.Text(note.title, weight=ft.FontWeight.BOLD, size=14),
-                    subtitle=ft.Text(
-                        note.modified_time.strftime("%m/%d/%Y %H:%M") if note.modified_time else "No date",
-                        size=12
-                    ),
-                    on_click=lambda e, n=note: self.select_note(n),
-                    content_padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                    selected=is_selected,
-                ),
-                elevation=2 if is_selected else 1,
-                margin=ft.margin.all(2),
-                color=ft.Colors.BLUE_50 if is_selected else None,
-            )
-            self.notes_list_view.controls.append(note_card)
-        
-        self.page.update()
+            # Safety check for notes_list_view
+            if not hasattr(self, 'notes_list_view') or not self.notes_list_view:
+                return
+            
+            if notes is None:
+                notes = self.get_notes_for_query(self._last_search_query)
+            
+            # Reuse the existing card of each note, creating cards only for new notes
+            cards = []
+            for note in notes:
+                card = self._note_cards.get(note.filepath)
+                if card is None:
+                    card = self._note_cards[note.filepath] = self.create_note_card(note)
+                else:
+                    self.update_note_card(card, note)
+                cards.append(card)
+            
+            # Forget cards of notes that no longer exist (not just filtered out)
+            by_path = self.notes_manager.by_path
+            if len(self._note_cards) > len(by_path):
+                for path in [path for path in self._note_cards if path not in by_path]:
+                    del self._note_cards[path]
+            
+            controls = self.notes_list_view.controls
+            if len(controls) != len(cards) or any(a is not b for a, b in zip(controls, cards)):
+                controls[:] = cards
+            
+            self._request_update(self.notes_list_view)
+    
+    def create_note_card(self, note: Note):
+        """Create a card for a note in the notes list."""
+        card = ft.Card(
+            ft.ListTile(
+                title=ft.Text(note.title, weight=ft.FontWeight.BOLD, size=14),
+                subtitle=ft.Text(self._note_date_text(note), size=12),
+                data=note,
+                on_click=self._on_note_click,
+                content_padding=ft.padding.symmetric(horizontal=8, vertical=4),
+            ),
+            margin=ft.margin.all(2),
+        )
+        self._set_note_card_selected(card, self._is_current_note(note))
+        return card
+    
+    def update_note_card(self, card: ft.Card, note: Note):
+        """Bring an existing note card up to date with its note."""
+        tile = card.content
+        tile.data = note
+        tile.title.value = note.title
+        tile.subtitle.value = self._note_date_text(note)
+        self._set_note_card_selected(card, self._is_current_note(note))
+    
+    def _note_date_text(self, note: Note) -> str:
+        """Format the modification time shown on a note card."""
+        return note.modified_time.strftime("%m/%d/%Y %H:%M") if note.modified_time else "No date"
+    
+    def _is_current_note(self, note: Note) -> bool:
+        """Check if a note is the currently selected one, using filepath as identifier."""
+        return bool(self.current_note and self.current_note.filepath == note.filepath)
+    
+    def _set_note_card_selected(self, card: ft.Card, is_selected: bool):
+        """Apply the selected/unselected look to a note card."""
+        card.content.selected = is_selected
+        card.elevation = 2 if is_selected else 1
+        card.color = ft.Colors.BLUE_50 if is_selected else None
+    
+    def _on_note_click(self, e):
+        """Handle a click on a note card."""
+        self.select_note(e.control.data)
     
     def select_note(self, note: Note):
         """Select and load a note for preview."""
@@ -926,127 +1201,98 @@ class DoNotePadApp:
     
     def load_note(self, note: Note):
         """Load a note into the editor."""
-        self.current_note = note
-        self.note_has_unsaved_changes = False
-        
-        # Update edit content (now tab 1)
-        edit_tab = self.note_editor.tabs[1].content
-        edit_tab.value = note.content
-        
-        # Update preview - markdown is now in tab 0, nested in container
-        preview_tab = self.note_editor.tabs[0].content
-        preview_markdown = preview_tab.controls[0].content  # Container -> Markdown
-        preview_markdown.value = note.content or "# Empty Note\n\nStart writing..."
-        
-        # Switch to preview tab when selecting a note (now tab 0)
-        self.note_editor.selected_index = 0
-        
-        # Update status
-        self.update_note_status()
-        
-        # Refresh the notes list to update highlighting
-        self.refresh_notes()
-        
-        self.page.update()
+        with self._batch_updates():
+            previous_note = self.current_note
+            self.current_note = note
+            self.note_has_unsaved_changes = False
+            
+            # Update edit content (now tab 1)
+            edit_tab = self.note_editor.tabs[1].content
+            edit_tab.value = note.content
+            
+            # Update preview - markdown is now in tab 0, nested in container
+            preview_tab = self.note_editor.tabs[0].content
+            preview_markdown = preview_tab.controls[0].content  # Container -> Markdown
+            preview_markdown.value = note.content or "# Empty Note\n\nStart writing..."
+            
+            # Switch to preview tab when selecting a note (now tab 0)
+            self.note_editor.selected_index = 0
+            
+            # Update status
+            self.update_note_status()
+            
+            # Move the highlight from the previous note's card to this one
+            self.highlight_note_card(previous_note, note)
+            
+            self._request_update()
+    
+    def highlight_note_card(self, previous_note, note: Note):
+        """Update the selection look of only the previous and new note cards."""
+        changed = []
+        for other in (previous_note, note):
+            card = self._note_cards.get(other.filepath) if other else None
+            if card is not None and card not in changed:
+                self._set_note_card_selected(card, self._is_current_note(other))
+                changed.append(card)
+        if changed:
+            self._request_update(*changed)
     
     def update_note_status(self):
         """Update the note status indicator."""
         if not self.current_note:
-            self.note_status_text.value = ""
-            self.save_button.icon_color = None
+            state = ("", None, None)
         elif self.note_has_unsaved_changes:
-            self.note_status_text.value = "● Unsaved changes"
-            self.note_status_text.color = ft.Colors.ORANGE_600
-            self.save_button.icon_color = ft.Colors.ORANGE_600
+            state = ("● Unsaved changes", ft.Colors.ORANGE_600, ft.Colors.ORANGE_600)
         else:
-            self.note_status_text.value = "✓ Saved"
-            self.note_status_text.color = ft.Colors.GREEN_600
-            self.save_button.icon_color = None
-        self.page.update()
+            state = ("✓ Saved", ft.Colors.GREEN_600, None)
+        
+        # Called on every keystroke; skip the update when nothing changed
+        if state == self._last_status_state:
+            return
+        self._last_status_state = state
+        
+        value, color, icon_color = state
+        self.note_status_text.value = value
+        if color:
+            self.note_status_text.color = color
+        self.save_button.icon_color = icon_color
+        self._request_update(self.note_status_text, self.save_button)
     
     # Additional methods for dialogs, filters, etc.
     def get_current_date_filter(self):
         """Get the currently selected date filter."""
-        for filter_type, button in self.todo_filter_buttons.items():
-            if button.style and button.style.bgcolor == ft.Colors.BLUE_100:
-                return filter_type
-        return "all"
+        return self.date_filter
     
     def set_filter(self, filter_type: str, filter_value: str):
         """Unified method to set any filter type and refresh."""
-        if filter_type == "date":
-            # Special case: if setting date filter to "all", also reset other filters
-            if filter_value == "all":
-                self.selected_context = "all"
-                self.selected_project = "all"
-                # Update context and project filter buttons to reflect "all" selection
-                self.update_filter_counts("context")
-                self.update_filter_counts("project")
-                # Update button styles for context filters
-                for key, button in self.context_filter_buttons.items():
-                    selected = key == "all"
-                    button.style = ft.ButtonStyle(
-                        bgcolor=ft.Colors.GREEN_100 if selected else None,
-                        color=ft.Colors.GREEN_900 if selected else ft.Colors.GREY_800,
-                        padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                    )
-                # Update button styles for project filters  
-                for key, button in self.project_filter_buttons.items():
-                    selected = key == "all"
-                    button.style = ft.ButtonStyle(
-                        bgcolor=ft.Colors.PURPLE_100 if selected else None,
-                        color=ft.Colors.PURPLE_900 if selected else ft.Colors.GREY_800,
-                        padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                    )
-            
-            # Update date filter
-            for key, button in self.todo_filter_buttons.items():
-                selected = key == filter_value
-                count = self.count_todos_by_date_filter(key)
+        with self._batch_updates():
+            if filter_type == "date":
+                # Special case: if setting date filter to "all", also reset other filters
+                if filter_value == "all":
+                    self.selected_context = "all"
+                    self.selected_project = "all"
+                    # Update context and project filter buttons to reflect "all" selection
+                    self.apply_filter_selection("context", "all")
+                    self.apply_filter_selection("project", "all")
                 
-                # Update the button content (count is now in a Container with Text inside)
-                button.content.controls[1].content.value = str(count)
-                button.style = ft.ButtonStyle(
-                    bgcolor=ft.Colors.BLUE_100 if selected else None,
-                    color=ft.Colors.BLUE_800 if selected else ft.Colors.GREY_800,
-                    padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                )
-            self.date_filter = filter_value
+                self.date_filter = filter_value
+            elif filter_type == "context":
+                self.selected_context = filter_value
+            elif filter_type == "project":
+                self.selected_project = filter_value
             
-        elif filter_type == "context":
-            # Update context filter
-            for key, button in self.context_filter_buttons.items():
-                selected = key == filter_value
-                count = self.count_todos_by_context(key)
-                
-                # Update the button content (count is now in a Container with Text inside)
-                button.content.controls[1].content.value = str(count)
-                button.style = ft.ButtonStyle(
-                    bgcolor=ft.Colors.GREEN_100 if selected else None,
-                    color=ft.Colors.GREEN_900 if selected else ft.Colors.GREY_800,
-                    padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                )
-            self.selected_context = filter_value
+            self.apply_filter_selection(filter_type, filter_value)
             
-        elif filter_type == "project":
-            # Update project filter
-            for key, button in self.project_filter_buttons.items():
-                selected = key == filter_value
-                count = self.count_todos_by_project(key)
-                
-                # Update the button content (count is now in a Container with Text inside)
-                button.content.controls[1].content.value = str(count)
-                button.style = ft.ButtonStyle(
-                    bgcolor=ft.Colors.PURPLE_100 if selected else None,
-                    color=ft.Colors.PURPLE_900 if selected else ft.Colors.GREY_800,
-                    padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                )
-            self.selected_project = filter_value
-        
-        # Refresh todos for all filter types
-        self.refresh_todos()
-        self.page.update()
+            # Refresh todos for all filter types
+            self.refresh_todos()
+            self._request_update(self.todo_filter_panel)
 
+    def apply_filter_selection(self, button_type: str, selected_key: str):
+        """Style the filter buttons of one type to show the selected one."""
+        selected_style, buttons_attr = _FILTER_STYLES[button_type]
+        for key, button in getattr(self, buttons_attr).items():
+            button.style = selected_style if key == selected_key else _UNSELECTED_FILTER_STYLE
+    
     def set_date_filter(self, filter_type: str):
         """Set the date filter and refresh."""
         self.set_filter("date", filter_type)
@@ -1059,43 +1305,61 @@ class DoNotePadApp:
         """Set the project filter and refresh."""
         self.set_filter("project", project)
     
+    def invalidate_filter_counts(self):
+        """Mark the cached filter counts as stale after a data change."""
+        self._count_cache_valid = False
+    
+    def recompute_filter_counts(self):
+        """Recompute all filter counts in a single pass over the pending todos."""
+        date_counts = {'all': 0, 'today': 0, 'upcoming': 0, 'someday': 0, 'completed': 0}
+        context_counts = Counter()
+        project_counts = Counter()
+        
+        if self.todo_manager:
+            pending = self.todo_manager.get_pending_todos()
+            due_today, upcoming, someday = self.todo_manager.partition_pending(pending=pending)
+            date_counts['all'] = len(pending)
+            date_counts['today'] = len(due_today)
+            date_counts['upcoming'] = len(upcoming)
+            date_counts['someday'] = len(someday)
+            date_counts['completed'] = len(self.todo_manager.items) - len(pending)
+            for todo in pending:
+                # A todo counts once per tag, even if the tag is repeated
+                context_counts.update(set(todo.contexts))
+                project_counts.update(set(todo.projects))
+            
+            context_counts['all'] = project_counts['all'] = date_counts['all']
+        
+        self._count_cache = {'date': date_counts, 'context': context_counts, 'project': project_counts}
+        self._count_cache_valid = True
+    
+    def get_filter_count(self, button_type: str, filter_type: str) -> int:
+        """Get the cached todo count for a filter button."""
+        if not self._count_cache_valid:
+            self.recompute_filter_counts()
+        return self._count_cache[button_type].get(filter_type, 0)
+    
     def count_todos_by_date_filter(self, filter_type: str) -> int:
         """Count todos matching a date filter."""
-        if not self.todo_manager:
-            return 0
-        
-        if filter_type == "today":
-            return len(self.todo_manager.get_todos_due_today())
-        elif filter_type == "upcoming":
-            return len(self.todo_manager.get_todos_due_upcoming())
-        elif filter_type == "someday":
-            return len(self.todo_manager.get_todos_someday())
-        elif filter_type == "completed":
-            return len(self.todo_manager.get_completed_todos())
-        else:  # "all"
-            return len([todo for todo in self.todo_manager.items if not todo.completed])
+        return self.get_filter_count("date", filter_type)
     
     def count_todos_by_context(self, context: str) -> int:
         """Count todos matching a context filter."""
-        if not self.todo_manager:
-            return 0
-        
-        if context == "all":
-            return len([todo for todo in self.todo_manager.items if not todo.completed])
-        else:
-            return len([todo for todo in self.todo_manager.items if not todo.completed and context in todo.contexts])
+        return self.get_filter_count("context", context)
     
     def count_todos_by_project(self, project: str) -> int:
         """Count todos matching a project filter."""
+        return self.get_filter_count("project", project)
+    
+    def update_tag_filters(self):
+        """Update the context and project filter buttons from one tag lookup."""
         if not self.todo_manager:
-            return 0
-        
-        if project == "all":
-            return len([todo for todo in self.todo_manager.items if not todo.completed])
-        else:
-            return len([todo for todo in self.todo_manager.items if not todo.completed and project in todo.projects])
+            return
+        projects, contexts = self.todo_manager.get_all_tags()
+        self.update_context_filter(contexts)
+        self.update_project_filter(projects)
     
-    def update_context_filter(self):
+    def update_context_filter(self, contexts=None):
         """Update the context filter buttons."""
         if not self.todo_manager:
             return
@@ -1105,26 +1369,32 @@ class DoNotePadApp:
             return
         
         try:
-            self.context_filter_buttons.clear()
-            self.context_filter_container.controls.clear()
+            if contexts is None:
+                contexts = self.todo_manager.get_all_contexts()
             
-            # Add "All Contexts" button
-            all_button = self.create_context_filter_button("all", "All", self.selected_context == "all")
-            self.context_filter_container.controls.append(all_button)
+            # Same contexts as before: keep the buttons and only refresh counts
+            if list(self.context_filter_buttons) == ["all"] + contexts:
+                self.update_filter_counts()
+                return
+            
+            self.context_filter_buttons.clear()
+            self._forget_count_texts("context")
             
-            # Add buttons for each context
-            contexts = self.todo_manager.get_all_contexts()
-            for context in contexts:
-                button = self.create_context_filter_button(context, context, self.selected_context == context)
-                self.context_filter_container.controls.append(button)
+            # "All Contexts" button followed by one button per context
+            buttons = [self.create_context_filter_button("all", "All", self.selected_context == "all")]
+            buttons.extend(
+                self.create_context_filter_button(context, context, self.selected_context == context)
+                for context in contexts
+            )
+            self.context_filter_container.controls[:] = buttons
             
             # Update all filter counts
             self.update_filter_counts()
-            self.page.update()
+            self._request_update(self.context_filter_container)
         except Exception as ex:
             pass  # Silently handle context filter update errors
     
-    def update_project_filter(self):
+    def update_project_filter(self, projects=None):
         """Update the project filter buttons."""
         if not self.todo_manager:
             return
@@ -1134,50 +1404,54 @@ class DoNotePadApp:
             return
         
         try:
-            self.project_filter_buttons.clear()
-            self.project_filter_container.controls.clear()
+            if projects is None:
+                projects = self.todo_manager.get_all_projects()
             
-            # Add "All Projects" button
-            all_button = self.create_project_filter_button("all", "All", self.selected_project == "all")
-            self.project_filter_container.controls.append(all_button)
+            # Same projects as before: keep the buttons and only refresh counts
+            if list(self.project_filter_buttons) == ["all"] + projects:
+                self.update_filter_counts()
+                return
             
-            # Add buttons for each project
-            projects = self.todo_manager.get_all_projects()
-            for project in projects:
-                button = self.create_project_filter_button(project, project, self.selected_project == project)
-                self.project_filter_container.controls.append(button)
+            self.project_filter_buttons.clear()
+            self._forget_count_texts("project")
+            
+            # "All Projects" button followed by one button per project
+            buttons = [self.create_project_filter_button("all", "All", self.selected_project == "all")]
+            buttons.extend(
+                self.create_project_filter_button(project, project, self.selected_project == project)
+                for project in projects
+            )
+            self.project_filter_container.controls[:] = buttons
             
             # Update all filter counts
             self.update_filter_counts()
-            self.page.update()
+            self._request_update(self.project_filter_container)
         except Exception as ex:
             pass  # Silently handle project filter update errors
     
     def update_filter_counts(self, filter_type: str = "all"):
-        """Update the counts on filter buttons."""
-        try:
-            if filter_type in ["all", "date"]:
-                for key, button in self.todo_filter_buttons.items():
-                    if hasattr(button, 'content') and button.content and len(button.content.controls) > 1:
-                        count = self.count_todos_by_date_filter(key)
-                        # The count is now in a Container with a Text widget inside
-                        button.content.controls[1].content.value = str(count)
-            
-            if filter_type in ["all", "context"]:
-                for key, button in self.context_filter_buttons.items():
-                    if hasattr(button, 'content') and button.content and len(button.content.controls) > 1:
-                        count = self.count_todos_by_context(key)
-                        # The count is now in a Container with a Text widget inside
-                        button.content.controls[1].content.value = str(count)
-            
-            if filter_type in ["all", "project"]:
-                for key, button in self.project_filter_buttons.items():
-                    if hasattr(button, 'content') and button.content and len(button.content.controls) > 1:
-                        count = self.count_todos_by_project(key)
-                        # The count is now in a Container with a Text widget inside
-                        button.content.controls[1].content.value = str(count)
-        except Exception as ex:
-            pass  # Silently handle filter count update errors
+        """Update the counts on filter buttons, pushing only the ones that changed."""
+        changed = []
+        for (button_type, key), count_text in self._count_text.items():
+            if filter_type in ("all", button_type):
+                if self._set_count(count_text, self.get_filter_count(button_type, key)):
+                    changed.append(count_text)
+        if changed:
+            self._request_update(*changed)
+    
+    @staticmethod
+    def _set_count(count_text: ft.Text, count: int) -> bool:
+        """Set a filter button's count text; return whether its value changed."""
+        value = str(count)
+        if count_text.value == value:
+            return False
+        count_text.value = value
+        return True
+    
+    def _forget_count_texts(self, button_type: str):
+        """Drop count Text references for filter buttons that are being rebuilt."""
+        for key in [key for key in self._count_text if key[0] == button_type]:
+            del self._count_text[key]
 
     def update_date_filter_counts(self):
         """Update the counts on date filter buttons."""
@@ -1185,127 +1459,176 @@ class DoNotePadApp:
     
     def toggle_todo_completion(self, todo: TodoItem):
         """Toggle todo completion status."""
-        if self.todo_manager:
-            todo.toggle_completion()
-            self.todo_manager.update_todo(todo)
-            self.refresh_todos()
+        with self._batch_updates():
+            if self.todo_manager:
+                todo.toggle_completion()
+                self.todo_manager.update_todo(todo)
+                self.invalidate_filter_counts()
+                self.invalidate_todo_card(todo)
+                self.update_filter_counts()
+                self.refresh_todos()
+    
+    def _debounced_search(self, e):
+        """Run the notes search once typing pauses."""
+        if self._search_timer:
+            self._search_timer.cancel()
+            self._search_timer = None
+        # Nothing to do if the burst ended on the query already shown
+        if (e.control.value or "") == self._last_search_query:
+            return
+        self._search_timer = threading.Timer(self.search_debounce_delay, self.search_notes, args=(e,))
+        self._search_timer.daemon = True
+        self._search_timer.start()
     
     def search_notes(self, e):
         """Search notes by query."""
         if not self.notes_manager:
             return
         
-        query = e.control.value
-        if query:
-            notes = self.notes_manager.search_notes(query)
-        else:
-            notes = self.notes_manager.get_notes_by_title_sorted()
+        query = e.control.value or ""
+        self._last_search_query = query
         
-        # Update notes list (simplified for now)
-        self.refresh_notes()
+        # Search on the worker thread; a newer query supersedes a pending one.
+        # The worker gets a snapshot of the notes, as the UI thread may add or
+        # delete notes while it runs.
+        if self._search_future:
+            self._search_future.cancel()
+        future = self._search_pool.submit(
+            self._search_note_snapshot, self.notes_manager, self.notes_manager.notes, query
+        )
+        self._search_future = future
+        future.add_done_callback(self._on_search_done)
+    
+    def _on_search_done(self, future):
+        """Hand finished search results back to Flet to be shown."""
+        # Runs on the search worker; the UI is updated from a Flet handler thread
+        if future is not self._search_future or future.cancelled():
+            return
+        self.page.run_thread(self._show_search_results, future)
+    
+    def _show_search_results(self, future):
+        """Show search results unless a newer search has been started."""
+        if future is not self._search_future:
+            return
+        try:
+            notes = future.result()
+        except Exception as ex:
+            print(f"Error searching notes: {ex}")
+            return
+        self.refresh_notes(notes)
+    
+    @staticmethod
+    def _search_note_snapshot(notes_manager: NotesManager, notes, query: str):
+        """Search a snapshot of the notes for a query, sorted by title."""
+        return sorted(notes_manager.search_notes(query, notes), key=lambda note: note.title_lower)
+    
+    def get_notes_for_query(self, query: str):
+        """Get the notes to list for a search query, sorted by title."""
+        if not query:
+            return self.notes_manager.get_notes_by_title_sorted()
+        return sorted(self.notes_manager.search_notes(query), key=lambda note: note.title_lower)
     
     def on_note_content_changed(self, e):
         """Update preview when note content changes."""
-        if self.current_note:
-            # Mark as having unsaved changes
-            self.note_has_unsaved_changes = True
-            self.update_note_status()
-            
-            # Update preview tab with new content
-            preview_tab = self.note_editor.tabs[0].content
-            preview_markdown = preview_tab.controls[0].content
-            preview_markdown.value = e.control.value or "# Empty Note"
-            
-            self.page.update()
+        if not self.current_note:
+            return
+        
+        # Mark as having unsaved changes right away
+        self.note_has_unsaved_changes = True
+        self.update_note_status()
+        
+        # Re-render the preview markdown only once typing pauses
+        if self._preview_timer:
+            self._preview_timer.cancel()
+        self._preview_timer = threading.Timer(
+            self.preview_debounce_delay, self._update_preview, args=(self.current_note,)
+        )
+        self._preview_timer.daemon = True
+        self._preview_timer.start()
+    
+    def _update_preview(self, note: Note):
+        """Show the editor's current text in the preview tab (debounced)."""
+        self._preview_timer = None
+        # The note may have been switched or deleted while the timer was pending
+        if self.current_note is not note:
+            return
+        
+        edit_tab = self.note_editor.tabs[1].content
+        preview_tab = self.note_editor.tabs[0].content
+        preview_markdown = preview_tab.controls[0].content
+        value = edit_tab.value or "# Empty Note"
+        if preview_markdown.value != value:
+            preview_markdown.value = value
+            self._request_update(preview_markdown)
     
     def save_current_note(self, e):
         """Save the current note."""
-        if self.current_note:
-            # Get content from the edit tab (tab 1)
-            edit_tab = self.note_editor.tabs[1].content
-            content = edit_tab.value
-            
-            # Update note content and title, then save
-            self.current_note.update_content(content)
-            self.current_note.save()
-            
-            # Clear unsaved changes flag and update status
-            self.note_has_unsaved_changes = False
-            self.update_note_status()
-            
-            # Also update the preview tab
-            preview_tab = self.note_editor.tabs[0].content
-            preview_markdown = preview_tab.controls[0].content
-            preview_markdown.value = content or "# Empty Note\n\nStart writing..."
-            
-            # Refresh the notes list to show updated title
-            self.refresh_notes()
-            self.page.update()
+        with self._batch_updates():
+            if self.current_note:
+                # Get content from the edit tab (tab 1)
+                edit_tab = self.note_editor.tabs[1].content
+                content = edit_tab.value
+                
+                # Update note content and title, then save
+                self.current_note.update_content(content)
+                self.notes_manager.save_note(self.current_note)
+                
+                # Clear unsaved changes flag and update status
+                self.note_has_unsaved_changes = False
+                self.update_note_status()
+                
+                # Also update the preview tab
+                preview_tab = self.note_editor.tabs[0].content
+                preview_markdown = preview_tab.controls[0].content
+                preview_markdown.value = content or "# Empty Note\n\nStart writing..."
+                
+                # Refresh the notes list to show updated title
+                self.refresh_notes()
+                self._request_update()
     
     def show_save_before_navigation_dialog(self, continue_action):
         """Show dialog asking user to save before navigation."""
-        def save_and_continue(e):
+        def save_and_continue():
             self.save_current_note(None)
-            self.page.close(dialog)
-            self.current_dialog = None
             continue_action()
         
-        def continue_without_saving(e):
+        def continue_without_saving():
             # Clear unsaved changes flag and continue
             self.note_has_unsaved_changes = False
-            self.page.close(dialog)
-            self.current_dialog = None
             continue_action()
         
-        def cancel_navigation(e):
-            self.page.close(dialog)
-            self.current_dialog = None
-        
-        dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("Unsaved Changes"),
-            content=ft.Text(f"You have unsaved changes in '{self.current_note.title}'.\n\nDo you want to save before continuing?"),
-            actions=[
-                ft.TextButton("Cancel", on_click=cancel_navigation),
-                ft.TextButton("Don't Save", on_click=continue_without_saving),
-                ft.ElevatedButton("Save & Continue", on_click=save_and_continue),
-            ],
-        )
-        
-        self.current_dialog = dialog
-        self.page.open(dialog)
+        self.show_save_prompt("continuing", "Save & Continue", save_and_continue, continue_without_saving)
     
     def show_save_on_close_dialog(self):
         """Show dialog asking user to save before closing."""
-        def save_and_close(e):
+        def save_and_close():
             self.save_current_note(None)
-            self.page.close(dialog)
-            self.current_dialog = None
-            self.page.window_close()
-        
-        def close_without_saving(e):
-            self.page.close(dialog)
-            self.current_dialog = None
-            self.page.window_close()
+            self.page.window_destroy()
         
-        def cancel_close(e):
-            self.page.close(dialog)
-            self.current_dialog = None
-        
-        dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("Unsaved Changes"),
-            content=ft.Text(f"You have unsaved changes in '{self.current_note.title}'.\n\nDo you want to save before closing?"),
-            actions=[
-                ft.TextButton("Cancel", on_click=cancel_close),
-                ft.TextButton("Don't Save", on_click=close_without_saving),
-                ft.ElevatedButton("Save & Close", on_click=save_and_close),
-            ],
+        self.show_save_prompt("closing", "Save & Close", save_and_close, self.page.window_destroy)
+    
+    def show_save_prompt(self, before: str, save_label: str, on_save, on_discard):
+        """Open the shared "Unsaved Changes" dialog with the given actions."""
+        dialog = self._save_prompt_dialog
+        dialog.content.value = (
+            f"You have unsaved changes in '{self.current_note.title}'.\n\n"
+            f"Do you want to save before {before}?"
         )
+        self._save_prompt_save_button.text = save_label
+        self._save_prompt_handlers = {"save": on_save, "discard": on_discard}
         
         self.current_dialog = dialog
         self.page.open(dialog)
     
+    def _on_save_prompt_action(self, e):
+        """Close the save prompt and run the action of the clicked button."""
+        handler = self._save_prompt_handlers.get(e.control.data)
+        self._save_prompt_handlers = {}
+        self.page.close(self._save_prompt_dialog)
+        self.current_dialog = None
+        if handler:
+            handler()
+    
     def delete_current_note(self, e):
         """Delete the current note with confirmation."""
         if not self.current_note:
@@ -1330,7 +1653,7 @@ class DoNotePadApp:
                 preview_markdown = preview_tab.controls[0].content
                 preview_markdown.value = "Select a note to preview..."
                 
-                self.page.update()
+                self._request_update()
             close_dialog(e)
         
         confirm_dialog = ft.AlertDialog(
@@ -1346,8 +1669,25 @@ class DoNotePadApp:
         self.current_dialog = confirm_dialog
         self.page.open(confirm_dialog)
     
+    def open_due_date_picker(self, value, on_picked):
+        """Open the shared due date picker; on_picked gets the chosen date."""
+        today = date.today()
+        picker = self._due_date_picker
+        picker.first_date = min(today, value) if value else today
+        picker.value = value
+        self._due_date_picked = on_picked
+        self.page.open(picker)
+    
+    def _on_due_date_picked(self, e):
+        """Hand the date chosen in the shared picker to the dialog that opened it."""
+        value = self._due_date_picker.value
+        if self._due_date_picked and value:
+            # The picker reports a datetime; dialogs work with plain dates
+            self._due_date_picked(value.date() if isinstance(value, datetime) else value)
+    
     def add_todo_dialog(self, e):
         """Show dialog to add a new todo."""
+        selected_due_date = None
         
         def close_dialog(e):
             self.page.close(dialog)
@@ -1360,53 +1700,53 @@ class DoNotePadApp:
                 self.show_error("Error", "Please select a data folder first")
                 return
                 
-            if description:
-                # Create todo with raw description first - this will auto-parse todo.txt format
-                todo = self.todo_manager.add_todo(description)
-                
-                # Only override parsed values if form fields are explicitly set
-                # This allows users to use either the description format OR the form fields
-                
-                # Set priority from dropdown only if it's not "none" AND not already parsed
-                if priority_dropdown.value != "none" and not todo.priority:
-                    todo.set_priority(priority_dropdown.value)
-                
-                # Set due date from date picker only if checkbox is checked AND not already parsed
-                if due_date_checkbox.value and date_picker.value and not todo.due_date:
-                    todo.set_due_date(date_picker.value)
-                
-                # Add projects from field - add any that aren't already present
-                if projects_field.value:
-                    for project in projects_field.value.split(','):
-                        project = project.strip()
-                        if project and project not in todo.projects:
-                            todo.add_project(project)
-                
-                # Add contexts from field - add any that aren't already present
-                if contexts_field.value:
-                    for context in contexts_field.value.split(','):
-                        context = context.strip()
-                        if context and context not in todo.contexts:
-                            todo.add_context(context)
-                
-                # Save the updated todo
-                self.todo_manager.save_todos()
-                self.refresh_todos()
-                self.update_context_filter()
-                self.update_project_filter()
+            with self._batch_updates():
+                if description:
+                    # Create todo with raw description first - this will auto-parse todo.txt format
+                    todo = self.todo_manager.add_todo(description)
+                    added_line = todo.to_string()
+                    
+                    # Only override parsed values if form fields are explicitly set
+                    # This allows users to use either the description format OR the form fields
+                    
+                    # Set priority from dropdown only if it's not "none" AND not already parsed
+                    if priority_dropdown.value != "none" and not todo.priority:
+                        todo.set_priority(priority_dropdown.value)
+                    
+                    # Set due date from date picker only if checkbox is checked AND not already parsed
+                    if due_date_checkbox.value and selected_due_date and not todo.due_date:
+                        todo.set_due_date(selected_due_date)
+                    
+                    # Add projects from field - add any that aren't already present
+                    if projects_field.value:
+                        todo.add_projects(project.strip() for project in projects_field.value.split(','))
+                    
+                    # Add contexts from field - add any that aren't already present
+                    if contexts_field.value:
+                        todo.add_contexts(context.strip() for context in contexts_field.value.split(','))
+                    
+                    # Save the todo again only if the form fields changed it;
+                    # otherwise the line add_todo appended is already current
+                    if todo.to_string() != added_line:
+                        self.todo_manager.update_todo(todo)
+                    self.invalidate_filter_counts()
+                    self.refresh_todos()
+                    self.update_tag_filters()
             
             close_dialog(e)
         
         def on_due_date_checkbox_change(e):
             due_date_button.disabled = not e.control.value
-            self.page.update()
+            self._request_update(due_date_button)
         
         def open_date_picker(e):
-            self.page.open(date_picker)
+            self.open_due_date_picker(selected_due_date, on_date_picked)
         
-        def on_date_picked(e):
-            due_date_button.text = f"Due: {date_picker.value.strftime('%Y-%m-%d')}"
-            self.page.update()
+        def on_date_picked(value):
+            nonlocal selected_due_date
+            selected_due_date = value
+            due_date_button.text = f"Due: {value.strftime('%Y-%m-%d')}"
+            self._request_update(due_date_button)
         
         # Dialog fields
         description_field = ft.TextField(
@@ -1420,14 +1760,7 @@ class DoNotePadApp:
         )
         priority_dropdown = ft.Dropdown(
             label="Priority",
-            options=[
-                ft.dropdown.Option("none", "None"),
-                ft.dropdown.Option("A", "A (Highest)"),
-                ft.dropdown.Option("B", "B (High)"),
-                ft.dropdown.Option("C", "C (Medium)"),
-                ft.dropdown.Option("D", "D (Low)"),
-                ft.dropdown.Option("E", "E (Lowest)"),
-            ],
+            options=[ft.dropdown.Option(key, text) for key, text in _PRIORITY_CHOICES],
             value="none",
         )
         due_date_checkbox = ft.Checkbox(
@@ -1435,13 +1768,7 @@ class DoNotePadApp:
             on_change=on_due_date_checkbox_change
         )
         
-        # Date picker and button
-        date_picker = ft.DatePicker(
-            on_change=on_date_picked,
-            first_date=date.today(),
-            last_date=date(2030, 12, 31),
-        )
-        
+        # Date button (opens the shared date picker)
         due_date_button = ft.ElevatedButton(
             text="Select Date",
             icon=ft.Icons.CALENDAR_TODAY,
@@ -1483,8 +1810,6 @@ class DoNotePadApp:
             ],
         )
         
-        # Add the date picker to the page overlay
-        self.page.overlay.append(date_picker)
         self.current_dialog = dialog
         self.page.open(dialog)
     
@@ -1511,12 +1836,12 @@ class DoNotePadApp:
                 self.load_note(note)  # Use load_note directly since no unsaved changes
                 # Switch to edit mode (tab 1) after creating the note
                 self.note_editor.selected_index = 1
-                self.page.update()
+                self._request_update()
                 
                 # Focus on the edit text field
                 edit_tab = self.note_editor.tabs[1].content
                 edit_tab.focus()
-                self.page.update()
+                self._request_update()
             close_dialog(e)
         
         title_field = ft.TextField(
@@ -1583,21 +1908,22 @@ class DoNotePadApp:
 
     def edit_todo_dialog(self, todo: TodoItem):
         """Show dialog to edit an existing todo."""
+        selected_due_date = todo.due_date or date.today()
+        
         def close_dialog(e):
-            # Clean up the date picker from overlay
-            if edit_date_picker in self.page.overlay:
-                self.page.overlay.remove(edit_date_picker)
             self.page.close(dialog)
             self.current_dialog = None
         
         def delete_todo(e):
             # Show confirmation dialog for delete
             def confirm_delete(e):
-                if self.todo_manager:
-                    self.todo_manager.remove_todo(todo)
-                    self.refresh_todos()
-                    self.update_context_filter()
-                    self.update_project_filter()
+                with self._batch_updates():
+                    if self.todo_manager:
+                        self.todo_manager.remove_todo(todo)
+                        self.invalidate_filter_counts()
+                        self.invalidate_todo_card(todo)
+                        self.refresh_todos()
+                        self.update_tag_filters()
                 # Close both confirmation dialog and main edit dialog
                 self.page.close(confirm_dialog)
                 close_dialog(e)
@@ -1619,72 +1945,58 @@ class DoNotePadApp:
         
         def save_todo(e):
             description = description_field.value.strip()
-            if description and self.todo_manager:
-                # Get clean description without projects, contexts, due dates
-                clean_description = get_clean_description(description)
-                
-                # Start fresh with clean description
-                todo.description = clean_description
-                todo.projects.clear()
-                todo.contexts.clear()
-                
-                # Set priority
-                if priority_dropdown.value != "none":
-                    todo.set_priority(priority_dropdown.value)
-                else:
-                    todo.priority = None
-                
-                # Set due date from date picker
-                if due_date_checkbox.value and edit_date_picker.value:
-                    todo.set_due_date(edit_date_picker.value)
-                else:
-                    todo.set_due_date(None)
-                
-                # Add projects using proper method to update description
-                if projects_field.value:
-                    for project in projects_field.value.split(','):
-                        project = project.strip()
-                        if project:
-                            todo.add_project(project)
-                
-                # Add contexts using proper method to update description
-                if contexts_field.value:
-                    for context in contexts_field.value.split(','):
-                        context = context.strip()
-                        if context:
-                            todo.add_context(context)
-                
-                self.todo_manager.save_todos()
-                self.refresh_todos()
-                self.update_context_filter()
-                self.update_project_filter()
+            with self._batch_updates():
+                if description and self.todo_manager:
+                    # Get clean description without projects, contexts, due dates
+                    clean_description = TodoItem.strip_tags(description)
+                    
+                    # Start fresh with clean description
+                    todo.description = clean_description
+                    todo.clear_tags()
+                    
+                    # Set priority
+                    if priority_dropdown.value != "none":
+                        todo.set_priority(priority_dropdown.value)
+                    else:
+                        todo.set_priority(None)
+                    
+                    # Set due date from date picker
+                    if due_date_checkbox.value and selected_due_date:
+                        todo.set_due_date(selected_due_date)
+                    else:
+                        todo.set_due_date(None)
+                    
+                    # Add projects using proper method to update description
+                    if projects_field.value:
+                        todo.add_projects(project.strip() for project in projects_field.value.split(','))
+                    
+                    # Add contexts using proper method to update description
+                    if contexts_field.value:
+                        todo.add_contexts(context.strip() for context in contexts_field.value.split(','))
+                    
+                    self.todo_manager.update_todo(todo)
+                    self.invalidate_filter_counts()
+                    self.invalidate_todo_card(todo)
+                    self.refresh_todos()
+                    self.update_tag_filters()
             
             close_dialog(e)
         
         def on_due_date_checkbox_change(e):
             edit_due_date_button.disabled = not e.control.value
-            self.page.update()
+            self._request_update(edit_due_date_button)
         
         def open_edit_date_picker(e):
-            self.page.open(edit_date_picker)
+            self.open_due_date_picker(selected_due_date, on_edit_date_picked)
         
-        def on_edit_date_picked(e):
-            edit_due_date_button.text = f"Due: {edit_date_picker.value.strftime('%Y-%m-%d')}"
-            self.page.update()
-        
-        def get_clean_description(description: str) -> str:
-            """Extract clean description without projects, contexts, or due dates."""
-            import re
-            # Remove projects (+project)
-            text = re.sub(r'\s*\+\w+', '', description)
-            # Remove contexts (@context)
-            text = re.sub(r'\s*@\w+', '', text)
-            # Remove due dates (due:YYYY-MM-DD)
-            text = re.sub(r'\s*due:\d{4}-\d{2}-\d{2}', '', text)
-            return text.strip()
+        def on_edit_date_picked(value):
+            nonlocal selected_due_date
+            selected_due_date = value
+            edit_due_date_button.text = f"Due: {value.strftime('%Y-%m-%d')}"
+            self._request_update(edit_due_date_button)
         
         # Get clean description (without projects, contexts, or due date)
-        trimmed_description = get_clean_description(todo.description)
+        trimmed_description = todo.clean_description
         
         # Pre-populate dialog fields with current todo data
         description_field = ft.TextField(
@@ -1698,14 +2010,7 @@ class DoNotePadApp:
         
         priority_dropdown = ft.Dropdown(
             label="Priority",
-            options=[
-                ft.dropdown.Option("none", "None"),
-                ft.dropdown.Option("A", "A (Highest)"),
-                ft.dropdown.Option("B", "B (High)"),
-                ft.dropdown.Option("C", "C (Medium)"),
-                ft.dropdown.Option("D", "D (Low)"),
-                ft.dropdown.Option("E", "E (Lowest)"),
-            ],
+            options=[ft.dropdown.Option(key, text) for key, text in _PRIORITY_CHOICES],
             value=todo.priority if todo.priority else "none",
         )
         
@@ -1715,14 +2020,7 @@ class DoNotePadApp:
             on_change=on_due_date_checkbox_change
         )
         
-        # Date picker and button for edit dialog
-        edit_date_picker = ft.DatePicker(
-            on_change=on_edit_date_picked,
-            first_date=date.today(),
-            last_date=date(2030, 12, 31),
-            value=todo.due_date if todo.due_date else date.today(),
-        )
-        
+        # Date button for edit dialog (opens the shared date picker)
         edit_due_date_button = ft.ElevatedButton(
             text=f"Due: {todo.due_date.strftime('%Y-%m-%d')}" if todo.due_date else "Select Date",
             icon=ft.Icons.CALENDAR_TODAY,
@@ -1761,8 +2059,6 @@ class DoNotePadApp:
             ],
         )
         
-        # Add the date picker to the page overlay
-        self.page.overlay.append(edit_date_picker)
         self.current_dialog = dialog
         self.page.open(dialog)
     
@@ -1775,7 +2071,7 @@ class DoNotePadApp:
         def confirm_delete(e):
             if self.notes_manager:
                 self.notes_manager.delete_note(note)
-                if self.current_note and self.current_note.title == note.title:
+                if self.current_note is note:
                     self.current_note = None
                     # Clear edit tab (now tab 1)
                     edit_tab = self.note_editor.tabs[1].content
@@ -3,10 +3,15 @@ Notes manager for handling Markdown notes.
 """
 import os
 import re
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
+# Background writer for Note.save_async; one worker keeps writes in order
+_NOTE_WRITER = ThreadPoolExecutor(max_workers=1)
+
+
 class Note:
     """Represents a single Markdown note."""
     
@@ -14,38 +19,72 @@ class Note:
         self.filepath = filepath
         self.content = content
         self.title = self._extract_title()
-        self.modified_time = None
-        if filepath and os.path.exists(filepath):
-            self.modified_time = datetime.fromtimestamp(os.path.getmtime(filepath))
+        self._title_lower = None  # Lowercased title/content for search, cached
+        self._content_lower = None
+        self.modified_time = None  # Set by NotesManager.load_notes and on save
+        self._pending_save = None  # Future of the last save_async()
     
     def _extract_title(self) -> str:
         """Extract title from the first line of the note."""
         if not self.content:
             return "Untitled"
         
-        lines = self.content.split('\n')
-        if lines:
-            # Remove markdown heading markers
-            title = lines[0].strip()
-            title = re.sub(r'^#+\s*', '', title)  # Remove # markers
-            return title if title else "Untitled"
-        return "Untitled"
+        # Only look at the first line, without splitting the whole note
+        end = self.content.find('\n')
+        first_line = self.content if end < 0 else self.content[:end]
+        # Remove markdown heading markers
+        title = first_line.strip().lstrip('#').lstrip()
+        return title if title else "Untitled"
     
     def update_content(self, content: str):
         """Update the note content and refresh title."""
         self.content = content
         self.title = self._extract_title()
+        self._title_lower = None
+        self._content_lower = None
+    
+    @property
+    def title_lower(self) -> str:
+        """Lowercased title, for case-insensitive search (cached)."""
+        if self._title_lower is None:
+            self._title_lower = self.title.lower()
+        return self._title_lower
+    
+    @property
+    def content_lower(self) -> str:
+        """Lowercased content, for case-insensitive search (cached)."""
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
     
     def save(self):
         """Save the note to file."""
         if not self.filepath:
             return False
+        if not self._write(self.content):
+            return False
+        self.modified_time = datetime.now()
+        return True
+    
+    def save_async(self):
+        """Queue the current content to be saved on the background writer.
         
+        Returns the Future of the write, or None if the note has no file.
+        """
+        if not self.filepath:
+            return None
+        # Set here rather than on the writer, so the UI sees the new time
+        # as soon as the save is queued
+        self.modified_time = datetime.now()
+        self._pending_save = _NOTE_WRITER.submit(self._write, self.content)
+        return self._pending_save
+    
+    def _write(self, content: str) -> bool:
+        """Write the given content to the note's file."""
         try:
             os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
             with open(self.filepath, 'w', encoding='utf-8') as f:
-                f.write(self.content)
-            self.modified_time = datetime.now()
+                f.write(content)
             return True
         except Exception as e:
             print(f"Error saving note: {e}")
@@ -53,6 +92,10 @@ class Note:
     
     def delete(self):
         """Delete the note file."""
+        # A queued background save must not recreate the file afterwards
+        if self._pending_save:
+            self._pending_save.result()
+            self._pending_save = None
         if self.filepath and os.path.exists(self.filepath):
             try:
                 os.remove(self.filepath)
@@ -69,10 +112,16 @@ class NotesManager:
     def __init__(self, data_folder: str):
         self.data_folder = data_folder
         self.notes_folder = os.path.join(data_folder, 'notes')
-        self.notes: List[Note] = []
+        self.by_path: Dict[str, Note] = {}  # filepath -> note, in load order
+        self._sorted_by_title: Optional[List[Note]] = None  # Cached title order
         self._ensure_notes_folder()
         self.load_notes()
     
+    @property
+    def notes(self) -> List[Note]:
+        """All notes, in load order."""
+        return list(self.by_path.values())
+    
     def _ensure_notes_folder(self):
         """Ensure the notes folder exists."""
         if not os.path.exists(self.notes_folder):
@@ -80,24 +129,47 @@ class NotesManager:
     
     def load_notes(self):
         """Load all notes from the notes folder."""
-        self.notes = []
+        self.by_path = {}
+        self._sorted_by_title = None
         if not os.path.exists(self.notes_folder):
             return
         
         try:
-            for filename in os.listdir(self.notes_folder):
-                if filename.endswith('.md'):
-                    filepath = os.path.join(self.notes_folder, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        note = Note(filepath, content)
-                        self.notes.append(note)
-                    except Exception as e:
-                        print(f"Error loading note {filename}: {e}")
+            filepaths = [os.path.join(self.notes_folder, filename)
+                         for filename in os.listdir(self.notes_folder)
+                         if filename.endswith('.md')]
+            if not filepaths:
+                return
+            
+            # Overlap the file reads; the GIL is released while waiting on IO
+            with ThreadPoolExecutor(max_workers=min(32, len(filepaths))) as pool:
+                results = list(pool.map(self._read_note_file, filepaths))
+            
+            for filepath, result in zip(filepaths, results):
+                if result is None:
+                    continue
+                content, modified_time = result
+                note = Note(filepath, content)
+                note.modified_time = modified_time
+                self.by_path[filepath] = note
         except Exception as e:
             print(f"Error loading notes: {e}")
     
+    @staticmethod
+    def _read_note_file(filepath: str) -> Optional[Tuple[str, datetime]]:
+        """Read a note file's content and modification time.
+        
+        The time comes from fstat on the already open file, so no separate
+        path lookup is needed. Returns None if the file can't be read.
+        """
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                modified_time = datetime.fromtimestamp(os.fstat(f.fileno()).st_mtime)
+                return f.read(), modified_time
+        except Exception as e:
+            print(f"Error loading note {os.path.basename(filepath)}: {e}")
+            return None
+    
     def create_note(self, title: str = "New Note", content: str = "") -> Note:
         """Create a new note."""
         # Sanitize title for filename
@@ -125,42 +197,54 @@ class NotesManager:
         
         note = Note(filepath, content)
         note.save()
-        self.notes.append(note)
+        self.by_path[filepath] = note
+        self._sorted_by_title = None
         return note
     
     def delete_note(self, note: Note):
         """Delete a note."""
-        if note in self.notes:
-            note.delete()
-            self.notes.remove(note)
+        if self.by_path.get(note.filepath) is not note:
+            return
+        del self.by_path[note.filepath]
+        note.delete()
+        self._sorted_by_title = None
     
     def save_note(self, note: Note):
-        """Save a note."""
-        note.save()
+        """Save a note in the background; returns the Future of the write."""
+        # Its title may have changed along with its content
+        self._sorted_by_title = None
+        return note.save_async()
     
-    def search_notes(self, query: str) -> List[Note]:
-        """Search notes by content."""
+    def search_notes(self, query: str, notes: Optional[List[Note]] = None) -> List[Note]:
+        """Search notes by content.
+        
+        Searches the given notes instead of all notes when provided, e.g. a
+        snapshot taken for a search running off the UI thread.
+        """
+        if notes is None:
+            notes = self.notes
         if not query:
-            return self.notes
+            return notes
         
         query_lower = query.lower()
         matching_notes = []
         
-        for note in self.notes:
+        for note in notes:
             # Search in title and content
-            if (query_lower in note.title.lower() or 
-                query_lower in note.content.lower()):
+            if query_lower in note.title_lower or query_lower in note.content_lower:
                 matching_notes.append(note)
         
         return matching_notes
     
     def get_notes_by_title_sorted(self) -> List[Note]:
-        """Get notes sorted by title."""
-        return sorted(self.notes, key=lambda note: note.title.lower())
+        """Get notes sorted by title (cached until notes are added, removed or saved)."""
+        if self._sorted_by_title is None:
+            self._sorted_by_title = sorted(self.by_path.values(), key=lambda note: note.title_lower)
+        return list(self._sorted_by_title)
     
     def get_notes_by_modified_date(self) -> List[Note]:
         """Get notes sorted by modification date (newest first)."""
-        return sorted(self.notes, key=lambda note: note.modified_time or datetime.min, reverse=True)
+        return sorted(self.by_path.values(), key=lambda note: note.modified_time or datetime.min, reverse=True)
     
     def refresh_notes(self):
         """Refresh the notes list from the filesystem."""
@@ -2,8 +2,26 @@
 Todo item model following todo.txt syntax.
 """
 import re
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, date
+from typing import Iterable, List, Optional, Set
+
+
+# Sort rank for priorities (A=0 ... E=4); anything else sorts as 5
+_PRIORITY_ORDER = {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'E': 4}
+
+# Matches +project, @context and due:YYYY-MM-DD tags (with leading whitespace)
+_TAG_STRIP_RE = re.compile(r'\s*(?:\+\w+|@\w+|due:\d{4}-\d{2}-\d{2})')
+
+# todo.txt parsing patterns, compiled once for every item parsed
+_DATE_PREFIX_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})\s+')
+_PRIORITY_RE = re.compile(r'^\(([A-Z])\)\s+')
+# +project and @context in one alternation, for a single scan. The due date
+# is searched separately: a due: tag can sit inside a word (e.g. +work_due:...)
+# that this scan consumes as a project or context.
+_TAGS_RE = re.compile(r'\+(?P<proj>\w+)|@(?P<ctx>\w+)')
+_DUE_RE = re.compile(r'due:(\d{4}-\d{2}-\d{2})')
+_DUE_TAG_RE = re.compile(r'due:\d{4}-\d{2}-\d{2}')
+_DUE_STRIP_RE = re.compile(r'\s*due:\d{4}-\d{2}-\d{2}')
 
 
 class TodoItem:
@@ -15,12 +33,23 @@ class TodoItem:
         self.priority = None
         self.completion_date = None
         self.creation_date = None
-        self.description = ""
+        self._description = ""
+        self._clean_description = None
+        self._formatted_projects = None
+        self._formatted_contexts = None
         self.projects = []
         self.contexts = []
+        # Sets mirroring projects/contexts for O(1) membership tests
+        self._project_set = set()
+        self._context_set = set()
         self.due_date = None
         
+        # Precomputed sort keys, kept in sync by _update_sort_keys()
+        self.due_sort_key = date.max
+        self.priority_sort_key = 5
+        
         self._parse()
+        self._update_sort_keys()
     
     def _parse(self):
         """Parse the raw text according to todo.txt syntax."""
@@ -35,69 +64,118 @@ class TodoItem:
             text = text[2:]  # Remove 'x '
             
             # Extract completion date if present
-            date_match = re.match(r'^(\d{4}-\d{2}-\d{2})\s+', text)
+            date_match = _DATE_PREFIX_RE.match(text)
             if date_match:
                 try:
-                    self.completion_date = datetime.strptime(date_match.group(1), '%Y-%m-%d').date()
+                    self.completion_date = date.fromisoformat(date_match.group(1))
                     text = text[len(date_match.group(0)):]
                 except ValueError:
                     pass
         
         # Extract priority
-        priority_match = re.match(r'^\(([A-Z])\)\s+', text)
+        priority_match = _PRIORITY_RE.match(text)
         if priority_match:
             self.priority = priority_match.group(1)
             text = text[len(priority_match.group(0)):]
         
         # Extract creation date if present and not already parsed as completion date
         if not self.completion_date:
-            date_match = re.match(r'^(\d{4}-\d{2}-\d{2})\s+', text)
+            date_match = _DATE_PREFIX_RE.match(text)
             if date_match:
                 try:
-                    self.creation_date = datetime.strptime(date_match.group(1), '%Y-%m-%d').date()
+                    self.creation_date = date.fromisoformat(date_match.group(1))
                     text = text[len(date_match.group(0)):]
                 except ValueError:
                     pass
         
-        # Extract projects (+project)
-        self.projects = re.findall(r'\+(\w+)', text)
-        
-        # Extract contexts (@context)
-        self.contexts = re.findall(r'@(\w+)', text)
+        # Extract projects (+project) and contexts (@context) in a single pass
+        projects = []
+        contexts = []
+        for match in _TAGS_RE.finditer(text):
+            if match.lastgroup == 'proj':
+                projects.append(match.group('proj'))
+            else:
+                contexts.append(match.group('ctx'))
+        self.projects = projects
+        self.contexts = contexts
+        self._project_set = set(projects)
+        self._context_set = set(contexts)
         
         # Extract due date (due:YYYY-MM-DD)
-        due_match = re.search(r'due:(\d{4}-\d{2}-\d{2})', text)
+        due_match = _DUE_RE.search(text)
         if due_match:
             try:
-                self.due_date = datetime.strptime(due_match.group(1), '%Y-%m-%d').date()
+                self.due_date = date.fromisoformat(due_match.group(1))
             except ValueError:
                 pass
         
         # The remaining text is the description
         self.description = text.strip()
     
+    @property
+    def description(self) -> str:
+        """The todo text, including project, context and due date tags."""
+        return self._description
+    
+    @description.setter
+    def description(self, value: str):
+        # Tags always change together with the description, so this also
+        # invalidates the cached tag labels
+        self._description = value
+        self._clean_description = None
+        self._formatted_projects = None
+        self._formatted_contexts = None
+    
+    @property
+    def clean_description(self) -> str:
+        """The description without projects, contexts, or due dates (cached)."""
+        if self._clean_description is None:
+            self._clean_description = self.strip_tags(self._description)
+        return self._clean_description
+    
+    @property
+    def formatted_projects(self) -> List[str]:
+        """Project labels as shown in todo.txt, e.g. '+work' (cached)."""
+        if self._formatted_projects is None:
+            self._formatted_projects = [f"+{project}" for project in self.projects]
+        return self._formatted_projects
+    
+    @property
+    def formatted_contexts(self) -> List[str]:
+        """Context labels as shown in todo.txt, e.g. '@home' (cached)."""
+        if self._formatted_contexts is None:
+            self._formatted_contexts = [f"@{context}" for context in self.contexts]
+        return self._formatted_contexts
+    
+    @staticmethod
+    def strip_tags(text: str) -> str:
+        """Remove +project, @context and due:YYYY-MM-DD tags from text."""
+        return _TAG_STRIP_RE.sub('', text).strip()
+    
+    def _update_sort_keys(self):
+        """Refresh the precomputed due date and priority sort keys."""
+        self.due_sort_key = self.due_date or date.max
+        self.priority_sort_key = _PRIORITY_ORDER.get(self.priority, 5)
+    
     def to_string(self) -> str:
         """Convert the todo item back to todo.txt format."""
-        parts = []
+        # Formatted directly per case; this runs for every item on each save
+        description = self.description
         
-        # Completion marker
+        # Completion marker and date (priority and creation date are dropped)
         if self.completed:
-            parts.append('x')
             if self.completion_date:
-                parts.append(self.completion_date.strftime('%Y-%m-%d'))
-        
-        # Priority
-        if self.priority and not self.completed:
-            parts.append(f'({self.priority})')
-        
-        # Creation date
-        if self.creation_date and not self.completed:
-            parts.append(self.creation_date.strftime('%Y-%m-%d'))
+                return f'x {self.completion_date.isoformat()} {description}'
+            return f'x {description}'
         
-        # Description with projects and contexts
-        parts.append(self.description)
-        
-        return ' '.join(parts)
+        # Priority and creation date
+        if self.priority:
+            if self.creation_date:
+                return f'({self.priority}) {self.creation_date.isoformat()} {description}'
+            return f'({self.priority}) {description}'
+        if self.creation_date:
+            return f'{self.creation_date.isoformat()} {description}'
+        return description
     
     def toggle_completion(self):
         """Toggle the completion status of the todo item."""
@@ -113,33 +191,66 @@ class TodoItem:
             self.priority = priority.upper()
         else:
             self.priority = None
+        self._update_sort_keys()
     
     def add_project(self, project: str):
         """Add a project to the todo item."""
-        if project not in self.projects:
+        if project not in self._project_set:
+            self._project_set.add(project)
             self.projects.append(project)
             self.description = f"{self.description} +{project}".strip()
     
     def add_context(self, context: str):
         """Add a context to the todo item."""
-        if context not in self.contexts:
+        if context not in self._context_set:
+            self._context_set.add(context)
             self.contexts.append(context)
             self.description = f"{self.description} @{context}".strip()
     
+    def clear_tags(self):
+        """Forget all projects and contexts (the description is left as is)."""
+        self.projects.clear()
+        self.contexts.clear()
+        self._project_set.clear()
+        self._context_set.clear()
+        self._formatted_projects = None
+        self._formatted_contexts = None
+    
+    def add_projects(self, projects: Iterable[str]):
+        """Add several projects, rebuilding the description once."""
+        new = self._new_tags(projects, self._project_set)
+        if new:
+            self._project_set.update(new)
+            self.projects.extend(new)
+            self.description = " ".join([self.description, *(f"+{project}" for project in new)]).strip()
+    
+    def add_contexts(self, contexts: Iterable[str]):
+        """Add several contexts, rebuilding the description once."""
+        new = self._new_tags(contexts, self._context_set)
+        if new:
+            self._context_set.update(new)
+            self.contexts.extend(new)
+            self.description = " ".join([self.description, *(f"@{context}" for context in new)]).strip()
+    
+    @staticmethod
+    def _new_tags(tags: Iterable[str], existing: Set[str]) -> List[str]:
+        """Non-empty tags not already in existing, without duplicates, in order."""
+        return [tag for tag in dict.fromkeys(tags) if tag and tag not in existing]
+    
     def set_due_date(self, due_date: Optional[datetime]):
         """Set the due date of the todo item."""
         if due_date:
             self.due_date = due_date.date() if isinstance(due_date, datetime) else due_date
             # Add or update due date in description
-            due_pattern = r'due:\d{4}-\d{2}-\d{2}'
-            if re.search(due_pattern, self.description):
-                self.description = re.sub(due_pattern, f'due:{self.due_date}', self.description)
+            if _DUE_TAG_RE.search(self.description):
+                self.description = _DUE_TAG_RE.sub(f'due:{self.due_date}', self.description)
             else:
                 self.description = f"{self.description} due:{self.due_date}".strip()
         else:
             self.due_date = None
             # Remove due date from description
-            self.description = re.sub(r'\s*due:\d{4}-\d{2}-\d{2}', '', self.description).strip()
+            self.description = _DUE_STRIP_RE.sub('', self.description).strip()
+        self._update_sort_keys()
     
     def __str__(self):
         return self.to_string()
@@ -2,11 +2,17 @@
 Todo list manager for reading and writing todo.txt files.
 """
 import os
-from typing import List, Optional
+import threading
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, date
 from .todo_item import TodoItem
 
 
+# Sorts after every priority letter, so todos without a priority come last
+_NO_PRIORITY_KEY = '~'
+
+
 class TodoManager:
     """Manages todo items and file operations."""
     
@@ -14,6 +20,18 @@ class TodoManager:
         self.data_folder = data_folder
         self.todo_file = os.path.join(data_folder, 'todo.txt')
         self.items: List[TodoItem] = []
+        self.by_id: Dict[int, TodoItem] = {}  # id(item) -> item, for UI lookups
+        # Inverted indexes: tag -> todos carrying that tag
+        self.by_context: Dict[str, Set[TodoItem]] = {}
+        self.by_project: Dict[str, Set[TodoItem]] = {}
+        self._indexed_tags = {}  # id(item) -> (projects, contexts) as last indexed
+        # Debounced saving: changes within save_delay seconds share one write
+        self.save_delay = 0.3
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        # Whether new todos can be appended, i.e. the file is missing or
+        # ends with a newline
+        self._can_append = False
         self._ensure_data_folder()
         self.load_todos()
     
@@ -25,24 +43,94 @@ class TodoManager:
     def load_todos(self):
         """Load todos from the todo.txt file."""
         self.items = []
+        self.by_id = {}
+        self.by_context = {}
+        self.by_project = {}
+        self._indexed_tags = {}
+        self._can_append = not os.path.exists(self.todo_file)
         if os.path.exists(self.todo_file):
             try:
                 with open(self.todo_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:  # Skip empty lines
-                            self.items.append(TodoItem(line))
+                    data = f.read()
+                self._can_append = not data or data.endswith('\n')
+                for line in data.split('\n'):
+                    # Skip empty lines; TodoItem strips the rest itself
+                    if line and not line.isspace():
+                        item = TodoItem(line)
+                        self.items.append(item)
+                        self._index_item(item)
             except Exception as e:
                 print(f"Error loading todos: {e}")
     
+    def _index_item(self, item: TodoItem):
+        """Add a todo item to the id and context/project indexes."""
+        self.by_id[id(item)] = item
+        self._index_tags(item)
+    
+    def _unindex_item(self, item: TodoItem):
+        """Remove a todo item from the id and context/project indexes."""
+        self.by_id.pop(id(item), None)
+        self._unindex_tags(item)
+    
+    def _index_tags(self, item: TodoItem):
+        """Add a todo item to the context/project indexes."""
+        projects = set(item.projects)
+        contexts = set(item.contexts)
+        for project in projects:
+            self.by_project.setdefault(project, set()).add(item)
+        for context in contexts:
+            self.by_context.setdefault(context, set()).add(item)
+        self._indexed_tags[id(item)] = (projects, contexts)
+    
+    def _unindex_tags(self, item: TodoItem):
+        """Remove a todo item from the context/project indexes."""
+        projects, contexts = self._indexed_tags.pop(id(item), ((), ()))
+        for project in projects:
+            self._discard_from_index(self.by_project, project, item)
+        for context in contexts:
+            self._discard_from_index(self.by_context, context, item)
+    
+    @staticmethod
+    def _discard_from_index(index: Dict[str, Set[TodoItem]], tag: str, item: TodoItem):
+        """Remove an item from an index bucket, dropping the bucket when empty."""
+        bucket = index.get(tag)
+        if bucket is not None:
+            bucket.discard(item)
+            if not bucket:
+                del index[tag]
+    
     def save_todos(self):
-        """Save todos to the todo.txt file."""
-        try:
-            with open(self.todo_file, 'w', encoding='utf-8') as f:
-                for item in self.items:
-                    f.write(item.to_string() + '\n')
-        except Exception as e:
-            print(f"Error saving todos: {e}")
+        """Schedule a save of the todo.txt file in the background.
+        
+        Calls within save_delay seconds of each other are coalesced into a
+        single write. The timer thread is not a daemon, so a pending save
+        still completes when the app exits.
+        """
+        if self._save_timer:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.save_delay, self._save_todos_now)
+        self._save_timer.start()
+    
+    def flush(self):
+        """Write any pending changes to the todo.txt file right away."""
+        timer, self._save_timer = self._save_timer, None
+        if timer:
+            timer.cancel()
+            self._save_todos_now()
+    
+    def _save_todos_now(self):
+        """Save todos to the todo.txt file atomically via a temporary file."""
+        with self._save_lock:
+            try:
+                items = list(self.items)
+                data = '\n'.join([item.to_string() for item in items]) + '\n' if items else ''
+                tmp_file = self.todo_file + '.tmp'
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.todo_file)
+                self._can_append = True
+            except Exception as e:
+                print(f"Error saving todos: {e}")
     
     def add_todo(self, description: str, priority: Optional[str] = None) -> TodoItem:
         """Add a new todo item."""
@@ -57,18 +145,42 @@ class TodoManager:
         if priority and not item.priority:
             item.set_priority(priority)
         
-        self.items.append(item)
-        self.save_todos()
+        self._index_item(item)
+        self._append_todo(item)
         return item
     
+    def _append_todo(self, item: TodoItem):
+        """Add an item and append just its line to the todo.txt file.
+        
+        Falls back to a full (debounced) save when the file can't simply be
+        appended to. Adding to the list and appending to the file happen
+        under the save lock, so a concurrent full save either already
+        includes the item (and replaces the appended file) or ran before it.
+        """
+        with self._save_lock:
+            self.items.append(item)
+            if self._can_append:
+                try:
+                    with open(self.todo_file, 'a', encoding='utf-8') as f:
+                        f.write(f"{item.to_string()}\n")
+                    return
+                except Exception as e:
+                    print(f"Error saving todos: {e}")
+        self.save_todos()
+    
     def remove_todo(self, item: TodoItem):
         """Remove a todo item."""
-        if item in self.items:
+        # by_id gives O(1) membership; only the list removal scans
+        if id(item) in self.by_id:
             self.items.remove(item)
+            self._unindex_item(item)
             self.save_todos()
     
     def update_todo(self, item: TodoItem):
         """Update a todo item and save."""
+        if (set(item.projects), set(item.contexts)) != self._indexed_tags.get(id(item)):
+            self._unindex_tags(item)
+            self._index_tags(item)
         self.save_todos()
     
     def get_todos_by_project(self, project: str) -> List[TodoItem]:
@@ -87,53 +199,62 @@ class TodoManager:
         """Get all pending (not completed) todos."""
         return [item for item in self.items if not item.completed]
     
+    def partition_pending(self, days: int = 5,
+                          pending: Optional[List[TodoItem]] = None) -> Tuple[List[TodoItem], List[TodoItem], List[TodoItem]]:
+        """Split pending todos by due date in one pass.
+        
+        Returns (due today or overdue, due in the next `days` days, without
+        a due date). Todos due later than that are in none of the lists.
+        Pass `pending` when the caller already has get_pending_todos().
+        """
+        today = date.today()
+        upcoming_date = date.fromordinal(today.toordinal() + days)
+        due_today, upcoming, someday = [], [], []
+        if pending is None:
+            pending = self.get_pending_todos()
+        for item in pending:
+            due_date = item.due_date
+            if not due_date:
+                someday.append(item)
+            elif due_date <= today:
+                due_today.append(item)
+            elif due_date <= upcoming_date:
+                upcoming.append(item)
+        return due_today, upcoming, someday
+    
     def get_todos_due_today(self) -> List[TodoItem]:
         """Get todos due today."""
-        today = date.today()
-        return [item for item in self.get_pending_todos() 
-                if item.due_date and item.due_date <= today]
+        return self.partition_pending()[0]
     
     def get_todos_due_upcoming(self, days: int = 5) -> List[TodoItem]:
         """Get todos due in the next few days."""
-        today = date.today()
-        upcoming_date = date.fromordinal(today.toordinal() + days)
-        return [item for item in self.get_pending_todos() 
-                if item.due_date and today < item.due_date <= upcoming_date]
+        return self.partition_pending(days)[1]
     
     def get_todos_someday(self) -> List[TodoItem]:
         """Get todos without a due date."""
-        return [item for item in self.get_pending_todos() if not item.due_date]
+        return self.partition_pending()[2]
+    
+    def get_all_tags(self) -> Tuple[List[str], List[str]]:
+        """Get all unique projects and contexts, each sorted."""
+        # The indexes drop empty buckets, so their keys are exactly the live tags
+        return sorted(self.by_project), sorted(self.by_context)
     
     def get_all_projects(self) -> List[str]:
         """Get all unique projects."""
-        projects = set()
-        for item in self.items:
-            projects.update(item.projects)
-        return sorted(list(projects))
+        return self.get_all_tags()[0]
     
     def get_all_contexts(self) -> List[str]:
         """Get all unique contexts."""
-        contexts = set()
-        for item in self.items:
-            contexts.update(item.contexts)
-        return sorted(list(contexts))
+        return self.get_all_tags()[1]
     
     def sort_by_priority(self, items: List[TodoItem]) -> List[TodoItem]:
         """Sort todos by priority (A-Z, then no priority)."""
-        def priority_key(item):
-            if item.priority:
-                return (0, item.priority)
-            else:
-                return (1, 'Z')  # No priority comes after Z
-        
-        return sorted(items, key=priority_key)
+        # Decorate once, then sort on the key with a C-level getter
+        decorated = [(item.priority or _NO_PRIORITY_KEY, item) for item in items]
+        decorated.sort(key=itemgetter(0))
+        return [item for _, item in decorated]
     
     def sort_by_due_date(self, items: List[TodoItem]) -> List[TodoItem]:
         """Sort todos by due date (earliest first, then no due date)."""
-        def due_date_key(item):
-            if item.due_date:
-                return (0, item.due_date)
-            else:
-                return (1, date.max)  # No due date comes last
-        
-        return sorted(items, key=due_date_key)
+        # due_sort_key is precomputed on each item (date.max without a due date)
+        return sorted(items, key=attrgetter('due_sort_key'))